@@ -5,14 +5,19 @@ import argparse
 import configparser
 import os
 import shutil
+import tempfile
 import json
+import threading
+from collections import deque
+from functools import lru_cache
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QHBoxLayout, QListWidget, QPushButton, QLabel,
+                             QHBoxLayout, QPushButton, QLabel,
                              QGraphicsView, QGraphicsScene, QTabWidget, QListWidgetItem,
                              QGraphicsPathItem, QCheckBox, QMenu, QSizePolicy, QSpacerItem,
-                             QButtonGroup, QTextEdit, QTreeWidget, QTreeWidgetItem, QLineEdit,
+                             QTextEdit, QTreeWidget, QTreeWidgetItem, QLineEdit,
                              QComboBox, QMessageBox, QWidgetAction)
-from PyQt6.QtCore import Qt, QMimeData, QPointF, QRectF, QTimer, QSize, QRect, QProcess, pyqtSignal, QPoint
+from PyQt6.QtCore import (Qt, QMimeData, QPointF, QRectF, QTimer, QSize, QProcess, pyqtSignal, QPoint,
+                          QObject, QRunnable, QThreadPool, QIODevice, QSignalBlocker)
 from PyQt6.QtGui import (QDrag, QColor, QPainter, QBrush, QPalette, QPen,
                          QPainterPath, QFontMetrics, QFont, QAction, QPixmap, QGuiApplication, QTextCursor, QActionGroup,
                          QKeySequence)
@@ -41,16 +46,19 @@ class ConfigManager:
         self.config = configparser.ConfigParser()
         self.config_dir = os.path.expanduser('~/.config/cable')
         self.config_file = os.path.join(self.config_dir, 'config.ini')
+        self._save_pending = False # A deferred save_config() is scheduled
         self.load_config()
+        # Write out any deferred changes before the event loop goes away
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
 
     def load_config(self):
         # Create directory if it doesn't exist
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
+        os.makedirs(self.config_dir, exist_ok=True)
 
-        # Load existing config or create with defaults
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
+        # Load existing config or create with defaults; read() skips a missing file
+        config_exists = bool(self.config.read(self.config_file))
 
         # Ensure DEFAULT section exists
         if 'DEFAULT' not in self.config:
@@ -67,36 +75,72 @@ class ConfigManager:
             'last_active_tab': '0'           # Add default for last active tab (0=Audio)
         }
 
+        defaults_added = False
         for key, value in defaults.items():
             if key not in self.config['DEFAULT']:
                 self.config['DEFAULT'][key] = value
+                defaults_added = True
 
-        self.save_config()
+        # Only write when the file is missing or gained defaults
+        if defaults_added or not config_exists:
+            self.save_config()
 
     def save_config(self):
-        with open(self.config_file, 'w') as configfile: # Corrected line 52: ' replaced with )
-            self.config.write(configfile)
+        self._save_pending = False
+        # Write a temporary file next to the real config (through any symlink) and swap it in,
+        # so a crash or kill mid-write never leaves a truncated config.ini behind
+        target = os.path.realpath(self.config_file)
+        configfile = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(target),
+                                                 prefix='.config-', suffix='.tmp', delete=False)
+        try:
+            with configfile:
+                self.config.write(configfile)
+            if os.path.exists(target):
+                shutil.copymode(target, configfile.name) # The temporary file is created 0600
+            os.replace(configfile.name, target)
+        finally:
+            if os.path.exists(configfile.name): # Only left over if something above failed
+                os.unlink(configfile.name)
+
+    def _schedule_save(self):
+        """Coalesce a burst of setter calls into a single save_config()"""
+        if QApplication.instance() is None:
+            self.save_config() # No event loop to defer to
+            return
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(50, self.flush)
+
+    def flush(self):
+        """Write pending changes now, if any"""
+        if self._save_pending:
+            self.save_config()
 
     def get_bool(self, key, default=True):
         return self.config['DEFAULT'].getboolean(key, default)
 
+    def _set_value(self, key, text):
+        """Store a setting, scheduling a save only if it actually changed"""
+        section = self.config['DEFAULT']
+        if section.get(key, raw=True) == text:
+            return # e.g. switching back to the last active tab
+        section[key] = text
+        self._schedule_save()
+
     def set_bool(self, key, value):
-        self.config['DEFAULT'][key] = 'True' if value else 'False' # Use title case for consistency
-        self.save_config()
+        self._set_value(key, 'True' if value else 'False') # Use title case for consistency
  
     def get_int(self, key, default=0):
         return self.config['DEFAULT'].getint(key, default)
  
     def set_int(self, key, value):
-        self.config['DEFAULT'][key] = str(value)
-        self.save_config()
+        self._set_value(key, str(value))
 
     def get_str(self, key, default=None):
         return self.config['DEFAULT'].get(key, default)
 
     def set_str(self, key, value):
-        self.config['DEFAULT'][key] = str(value) if value is not None else ''
-        self.save_config()
+        self._set_value(key, str(value) if value is not None else '')
  
 
 # --- Add PresetManager Class ---
@@ -228,6 +272,38 @@ class ElidedListWidgetItem(QListWidgetItem):
     # ... (keep existing ElidedListWidgetItem code) ...
     pass # Keep existing code
 
+_DIGIT_RUN_RE = re.compile(r'(\d+)')
+# jack_delay output: any millisecond reading means the loop is connected; full result lines
+# give "<frames> frames <ms> ms". [^\S\r\n] is whitespace that stays within one line.
+_LATENCY_MS_RE = re.compile(r'\d+\.\d+\s+ms')
+_LATENCY_RESULT_RE = re.compile(r'(\d+\.\d+)[^\S\r\n]+frames[^\S\r\n]+(\d+\.\d+)[^\S\r\n]+ms')
+
+@lru_cache(maxsize=4096)
+def _natural_sort_key(name):
+    """Sort key for natural ordering (numbers compare numerically)."""
+    # split() with a capturing group alternates text/digits, starting with text
+    # (possibly empty), so odd positions are always the numeric runs
+    return tuple(int(part) if i % 2 else part.lower()
+                 for i, part in enumerate(_DIGIT_RUN_RE.split(name)))
+
+@lru_cache(maxsize=256)
+def _render_drag_pixmap(text, color_rgba, font_key):
+    """Render (and cache) the pixmap shown under the cursor while dragging ports."""
+    font = QFont()
+    font.fromString(font_key)
+    font_metrics = QFontMetrics(font)
+    text_width = font_metrics.horizontalAdvance(text) + 10
+    pixmap_width = max(70, text_width)
+    pixmap = QPixmap(pixmap_width, 20)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor.fromRgba(color_rgba))
+    elided_text = font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, pixmap_width)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, elided_text)
+    painter.end()
+    return pixmap
+
 class PortTreeWidget(QTreeWidget):
     """A tree widget for displaying ports with collapsible groups"""
     itemDragged = pyqtSignal(QTreeWidgetItem)
@@ -241,11 +317,19 @@ class PortTreeWidget(QTreeWidget):
         self.setMinimumWidth(100)
         self._width = 150
         self.current_drag_highlight_item = None
+        self.drag_source_role = b"input" if port_role == 'output' else b"output" # Drops come from the opposite tree
+        self._drag_accepted = False # Result of _accepts_drag for the drag currently over this tree
         self.setHeaderHidden(True)
         self.setIndentation(15)
+        # Every row uses the tree font, so Qt can skip per-item size hints during layout and scrolling
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
         self.port_groups = {}  # Maps group names to group items
         self.port_items = {}   # Maps port names to port items
         self.group_order = []  # Stores the current order of top-level group names
+        self.applied_filter_text = None # Filter text last applied by filter_ports, None if items changed since
+        self.highlighted = set() # (is_group, name) of items currently drawn in a highlight color
+        self.layout_generation = 0 # Bumped whenever rows may have moved on screen, see mark_layout_changed
         self.setDragEnabled(True)
         # Allow selecting multiple items with Ctrl/Shift
         self.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
@@ -258,11 +342,26 @@ class PortTreeWidget(QTreeWidget):
         self.initialSelection = None
         # Add storage for mouse press position
         self.mousePressPos = None
+        # Context menus are created on first right-click and reused
+        self._port_menu = None
+        self._group_menu = None
+        self._context_item = None
+        self._context_group_items = []
+        # Anything that moves rows invalidates the connection lines drawn next to them
+        model = self.model()
+        for moved in (self.itemExpanded, self.itemCollapsed, self.verticalScrollBar().valueChanged,
+                      model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                      model.layoutChanged, model.modelReset):
+            moved.connect(self.mark_layout_changed)
 
         # Actions for Move Up/Down moved to JackConnectionManager
     def sizeHint(self):
         return QSize(self._width, 300)  # Default height
 
+    def mark_layout_changed(self, *args):
+        """Record that item rows may have moved, so connection lines need redrawing."""
+        self.layout_generation += 1
+
     # Removed addPort method, replaced by populate_tree
 
     def get_current_group_order(self):
@@ -274,22 +373,18 @@ class PortTreeWidget(QTreeWidget):
                 order.append(item.text(0))
         return order
 
+    @staticmethod
+    def _natural_sort_key(item_name):
+        """Sort key for natural ordering (numbers compare numerically)."""
+        # Treat None or non-string items gracefully if they somehow appear
+        if not isinstance(item_name, str):
+            return () # Or handle as appropriate
+        return _natural_sort_key(item_name)
+
     def _sort_items_naturally(self, items):
         """Sorts a list of strings using natural sorting (handles numbers)."""
-        def get_sort_key(item_name):
-            # Treat None or non-string items gracefully if they somehow appear
-            if not isinstance(item_name, str):
-                return [] # Or handle as appropriate
-            parts = re.split(r'(\d+)', item_name)
-            key = []
-            for part in parts:
-                if part.isdigit():
-                    key.append(int(part))
-                else:
-                    key.append(part.lower())
-            return key
         # Filter out None before sorting if necessary, though item_name should always be str here
-        return sorted([item for item in items if isinstance(item, str)], key=get_sort_key)
+        return sorted([item for item in items if isinstance(item, str)], key=self._natural_sort_key)
 
     def _calculate_untangled_order(self, all_ports, current_groups, ports_by_group, untangle_mode):
         """Calculates the group order based on connections.
@@ -324,8 +419,8 @@ class PortTreeWidget(QTreeWidget):
             if (is_midi and conn_type != 'midi') or (not is_midi and conn_type != 'audio'):
                 continue
 
-            out_group = out_port.split(':', 1)[0] if ':' in out_port else out_port
-            in_group = in_port.split(':', 1)[0] if ':' in in_port else in_port
+            out_group = out_port.partition(':')[0]
+            in_group = in_port.partition(':')[0]
 
             connected_output_groups.add(out_group)
             connected_input_groups.add(in_group)
@@ -366,7 +461,7 @@ class PortTreeWidget(QTreeWidget):
         all_primary_group_names = set()
         for port in all_system_primary_ports:
             if port and hasattr(port, 'name') and port.name: # Basic validation
-                group_name = port.name.split(':', 1)[0] if ':' in port.name else port.name
+                group_name = port.name.partition(':')[0]
                 all_primary_group_names.add(group_name)
         # print(f"All system primary group names ({'MIDI' if is_midi else 'Audio'}): {all_primary_group_names}")
         # --- End Get ALL primary groups ---
@@ -419,8 +514,8 @@ class PortTreeWidget(QTreeWidget):
                          conn_type = conn_dict.get("type", "audio")
                          if (is_midi and conn_type != 'midi') or (not is_midi and conn_type != 'audio'): continue
  
-                         out_group = out_port.split(':', 1)[0] if ':' in out_port else out_port
-                         in_group = in_port.split(':', 1)[0] if ':' in in_port else in_port
+                         out_group = out_port.partition(':')[0]
+                         in_group = in_port.partition(':')[0]
  
                          if out_group == group_name: # If this output group is the one we're processing
                              if in_group in primary_group_numbers: # And it connects to a numbered primary (input) group
@@ -470,16 +565,18 @@ class PortTreeWidget(QTreeWidget):
         return final_order
 
     def populate_tree(self, all_ports, previous_group_order):
-        """Clears and repopulates the tree, preserving group order or using untangle sort."""
-        # 1. Determine current groups and ports per group (remains the same)
-        current_groups = set()
+        """Clears and repopulates the tree, preserving group order or using untangle sort.
+        Returns False when the existing items already matched and were kept."""
+        # 1. Determine current groups and ports per group, one dict lookup per port
         ports_by_group = {}
         for port_name in all_ports:
-            group_name = port_name.split(':', 1)[0] if ':' in port_name else "Ungrouped"
-            current_groups.add(group_name)
-            if group_name not in ports_by_group:
-                ports_by_group[group_name] = []
-            ports_by_group[group_name].append(port_name)
+            before, sep, _ = port_name.partition(':')
+            group_name = before if sep else "Ungrouped"
+            group_ports = ports_by_group.get(group_name)
+            if group_ports is None:
+                group_ports = ports_by_group[group_name] = []
+            group_ports.append(port_name)
+        current_groups = set(ports_by_group)
 
         # 2. Determine final group order based on untangle mode
         untangle_mode = self.window().untangle_mode # Get current mode from main window
@@ -490,66 +587,205 @@ class PortTreeWidget(QTreeWidget):
             # Apply natural sorting to all groups when untangle is disabled
             final_ordered_group_names = self._sort_items_naturally(list(current_groups))
 
-        # 3. Clear internal state
-        self.port_groups = {}
-        self.port_items = {}
-        self.clear()
-
-        # 4. Create and add groups in the determined order
-        for group_name in final_ordered_group_names:
-            group_item = QTreeWidgetItem(self)
-            group_item.setText(0, group_name)
-            group_item.setFlags(group_item.flags() | Qt.ItemFlag.ItemIsAutoTristate)
-            group_item.setExpanded(True)  # Default to expanded
-            self.port_groups[group_name] = group_item
-
-            # Sort ports within each group naturally
-            sorted_ports = self._sort_items_naturally(ports_by_group[group_name])
-            for port_name in sorted_ports:
-                port_item = QTreeWidgetItem(group_item)
-                port_item.setText(0, port_name)
-                port_item.setData(0, Qt.ItemDataRole.UserRole, port_name)  # Store full port name
-                self.port_items[port_name] = port_item
-
-        # 5. Update the internal group order state
-        self.group_order = final_ordered_group_names
+        # Same ports in the same group order: the existing items are still correct
+        if (final_ordered_group_names == self.group_order and len(all_ports) == len(self.port_items)
+                and all(port_name in self.port_items for port_name in all_ports)):
+            return False
+
+        # Suspend painting and signals while the tree is rebuilt, so the insertion
+        # below costs one layout pass instead of one per port
+        updates_were_enabled = self.updatesEnabled() # May already be suspended by the caller
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # 3. Clear internal state
+            self.port_groups = {}
+            self.port_items = {}
+            self.clear()
+
+            # 4. Build all group and port items detached, then attach them in bulk
+            new_groups = []
+            port_items = self.port_items # Local reference for the inner loop
+            for group_name in final_ordered_group_names:
+                group_item = QTreeWidgetItem()
+                group_item.setText(0, group_name)
+                group_item.setFlags(group_item.flags() | Qt.ItemFlag.ItemIsAutoTristate)
+                self.port_groups[group_name] = group_item
+
+                # Sort ports within each group naturally
+                children = []
+                for port_name in self._sort_items_naturally(ports_by_group[group_name]):
+                    port_item = QTreeWidgetItem()
+                    port_item.setText(0, port_name) # Port items show, and are read back by, their full name
+                    port_items[port_name] = port_item
+                    children.append(port_item)
+                group_item.addChildren(children)
+                new_groups.append(group_item)
+            self.addTopLevelItems(new_groups)
+
+            # Expansion only sticks once the items are in the tree
+            self.expandAll()  # Default to expanded
+
+            # 5. Update the internal group order state
+            self.group_order = final_ordered_group_names
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(updates_were_enabled)
+        self.applied_filter_text = None # New items are unfiltered
+        return True
+
+    def addPort(self, port_name, expanded=True):
+        """Insert a single port, creating its group if needed, without rebuilding the tree."""
+        if port_name in self.port_items:
+            return self.port_items[port_name]
+        before, sep, _ = port_name.partition(':')
+        group_name = before if sep else "Ungrouped"
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            group_item = self.port_groups.get(group_name)
+            if group_item is None:
+                group_item = QTreeWidgetItem()
+                group_item.setText(0, group_name)
+                group_item.setFlags(group_item.flags() | Qt.ItemFlag.ItemIsAutoTristate)
+                # Untangled order depends on connections a new port doesn't have yet, so it goes last
+                index = self.topLevelItemCount()
+                if self.window().untangle_mode == 0:
+                    group_key = self._natural_sort_key(group_name)
+                    for i in range(self.topLevelItemCount()):
+                        if self._natural_sort_key(self.topLevelItem(i).text(0)) > group_key:
+                            index = i
+                            break
+                self.insertTopLevelItem(index, group_item)
+                group_item.setExpanded(expanded)
+                self.port_groups[group_name] = group_item
+                self.group_order.insert(index, group_name)
+
+            port_item = QTreeWidgetItem()
+            port_item.setText(0, port_name)
+            port_key = self._natural_sort_key(port_name)
+            index = group_item.childCount()
+            for i in range(group_item.childCount()):
+                if self._natural_sort_key(group_item.child(i).text(0)) > port_key:
+                    index = i
+                    break
+            group_item.insertChild(index, port_item)
+            self.port_items[port_name] = port_item
+            self.applied_filter_text = None # New item is unfiltered
+        finally:
+            self.setUpdatesEnabled(updates_were_enabled)
+        return port_item
+
+    def removePort(self, port_name):
+        """Remove a single port, dropping its group once empty. Returns True if it was present."""
+        port_item = self.port_items.pop(port_name, None)
+        if port_item is None:
+            return False
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            group_item = port_item.parent()
+            group_item.removeChild(port_item)
+            if group_item.childCount() == 0:
+                group_name = group_item.text(0)
+                self.takeTopLevelItem(self.indexOfTopLevelItem(group_item))
+                self.port_groups.pop(group_name, None)
+                if group_name in self.group_order:
+                    self.group_order.remove(group_name)
+        finally:
+            self.setUpdatesEnabled(updates_were_enabled)
+        return True
 
     def clear(self):
         super().clear()
         self.port_groups = {}
         self.port_items = {}
         self.group_order = [] # Reset stored order on clear
+        self.applied_filter_text = None
+        self.highlighted = set()
 
     def expandCollapseGroup(self, group_name, expand):
         """Expand or collapse a specific group by name"""
         group_item = self.port_groups.get(group_name)
         if group_item:
+            updates_were_enabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
             group_item.setExpanded(expand)
+            self.setUpdatesEnabled(updates_were_enabled)
 
     def expandAllGroups(self):
         """Expand all port groups"""
-        for group_item in self.port_groups.values():
-            group_item.setExpanded(True)
+        # One layout pass instead of one per group; the per-group itemExpanded
+        # signals would only bump the layout generation once each
+        with QSignalBlocker(self):
+            self.expandAll()
+        self.mark_layout_changed()
 
     def collapseAllGroups(self):
         """Collapse all port groups"""
-        for group_item in self.port_groups.values():
-            group_item.setExpanded(False)
+        with QSignalBlocker(self):
+            self.collapseAll()
+        self.mark_layout_changed()
+
+    def _ensure_context_menus(self):
+        """Build the port and group context menus on first use; they are reused afterwards."""
+        if self._port_menu is not None:
+            return
+        self._port_menu = QMenu(self)
+        disconnect_action = QAction("Disconnect all from this port", self)
+        disconnect_action.triggered.connect(self._on_disconnect_port_triggered)
+        self._port_menu.addAction(disconnect_action)
+
+        self._group_menu = QMenu(self)
+        # Toggle expand/collapse for the right-clicked group
+        self._toggle_group_action = QAction(self)
+        self._toggle_group_action.triggered.connect(self._on_toggle_group_triggered)
+
+        # Actions for all groups
+        expand_all_action = QAction("Expand all", self)
+        collapse_all_action = QAction("Collapse all", self)
+        expand_all_action.triggered.connect(self.expandAllGroups)
+        collapse_all_action.triggered.connect(self.collapseAllGroups)
+
+        # Action to disconnect all ports within the selected group(s)
+        self._disconnect_group_action = QAction(self)
+        self._disconnect_group_action.triggered.connect(self._on_disconnect_groups_triggered)
+
+        self._group_menu.addAction(self._toggle_group_action)
+        self._group_menu.addSeparator()
+        self._group_menu.addAction(expand_all_action)
+        self._group_menu.addAction(collapse_all_action)
+        self._group_menu.addSeparator()
+        self._group_menu.addAction(self._disconnect_group_action)
+
+        # --- Add Move Up/Down Actions ---
+        self._group_menu.addSeparator()
+        # Use the global actions from the main window
+        self._group_menu.addAction(self.window().move_group_up_action)
+        self._group_menu.addAction(self.window().move_group_down_action)
+        # --- End Move Up/Down Actions ---
+
+    def _on_disconnect_port_triggered(self):
+        if self._context_item is not None:
+            self.window().disconnect_node(self._context_item.text(0))
+
+    def _on_toggle_group_triggered(self):
+        if self._context_item is not None:
+            self._context_item.setExpanded(not self._context_item.isExpanded())
+
+    def _on_disconnect_groups_triggered(self):
+        if self._context_group_items:
+            self.window().disconnect_selected_groups(self._context_group_items)
 
     def show_context_menu(self, position):
         item = self.itemAt(position)
         if item:
+            self._ensure_context_menus()
+            self._context_item = item
             # Check if it's a port item (leaf node) or group item
             if item.childCount() == 0:  # Port item
-                port_name = item.data(0, Qt.ItemDataRole.UserRole)
-                menu = QMenu(self)
-                disconnect_action = QAction("Disconnect all from this port", self)
-                disconnect_action.triggered.connect(lambda checked, name=port_name:
-                                                  self.window().disconnect_node(name))
-                menu.addAction(disconnect_action)
-                menu.exec(self.mapToGlobal(position))
+                self._port_menu.exec(self.mapToGlobal(position))
             else:  # Group item
-                group_name = item.text(0)
                 is_expanded = item.isExpanded()
                 selected_items = self.selectedItems() # Get all selected items
 
@@ -560,50 +796,22 @@ class PortTreeWidget(QTreeWidget):
                 target_items = selected_items if is_current_item_selected and len(selected_items) > 1 else [item]
 
                 # Filter to only include group items from the target items
-                target_group_items = [i for i in target_items if i.childCount() > 0]
+                self._context_group_items = [i for i in target_items if i.childCount() > 0]
 
-                menu = QMenu(self)
-
-                # Toggle expand/collapse for this specific group
-                toggle_action = QAction("Collapse group" if is_expanded else "Expand group", self)
-                toggle_action.triggered.connect(lambda: item.setExpanded(not is_expanded))
-
-                # Actions for all groups
-                expand_all_action = QAction("Expand all", self)
-                collapse_all_action = QAction("Collapse all", self)
-                expand_all_action.triggered.connect(self.expandAllGroups)
-                collapse_all_action.triggered.connect(self.collapseAllGroups)
-
-                # Action to disconnect all ports within the selected group(s)
-                disconnect_group_action = QAction(f"Disconnect group{'s' if len(target_group_items) > 1 else ''}", self)
+                self._toggle_group_action.setText("Collapse group" if is_expanded else "Expand group")
+                self._disconnect_group_action.setText(f"Disconnect group{'s' if len(self._context_group_items) > 1 else ''}")
                 # Disable if no actual group items are targeted (shouldn't happen with current logic, but safe)
-                disconnect_group_action.setEnabled(bool(target_group_items))
-                disconnect_group_action.triggered.connect(lambda: self.window().disconnect_selected_groups(target_group_items))
-
-                menu.addAction(toggle_action)
-                menu.addSeparator()
-                menu.addAction(expand_all_action)
-                menu.addAction(collapse_all_action)
-                menu.addSeparator()
-                menu.addAction(disconnect_group_action)
-
-                # --- Add Move Up/Down Actions ---
-                menu.addSeparator()
-                # Use the global actions from the main window
-                move_up_action = self.window().move_group_up_action
-                move_down_action = self.window().move_group_down_action
-
-                # Update their enabled state based on the context item
-                current_index = self.indexOfTopLevelItem(item)
-                move_up_action.setEnabled(current_index > 0)
-                move_down_action.setEnabled(current_index < self.topLevelItemCount() - 1)
+                self._disconnect_group_action.setEnabled(bool(self._context_group_items))
 
-                # Add the global actions to the menu
-                menu.addAction(move_up_action)
-                menu.addAction(move_down_action)
-                # --- End Move Up/Down Actions ---
+                # Update the move actions' enabled state based on the context item
+                current_index = self.indexOfTopLevelItem(item)
+                self.window().move_group_up_action.setEnabled(current_index > 0)
+                self.window().move_group_down_action.setEnabled(current_index < self.topLevelItemCount() - 1)
 
-                menu.exec(self.mapToGlobal(position))
+                self._group_menu.exec(self.mapToGlobal(position))
+            # Don't keep tree items alive past the menu, a refresh may delete them
+            self._context_item = None
+            self._context_group_items = []
 
     def getSelectedPortNames(self):
         """Returns a list of port names for the currently selected port items."""
@@ -611,7 +819,7 @@ class PortTreeWidget(QTreeWidget):
         for item in self.selectedItems():
             # Only include actual port items (leaves), not groups
             if item and item.childCount() == 0:
-                port_name = item.data(0, Qt.ItemDataRole.UserRole)
+                port_name = item.text(0)
                 if port_name:
                     selected_ports.append(port_name)
         return selected_ports
@@ -620,21 +828,6 @@ class PortTreeWidget(QTreeWidget):
         """Returns the tree item for a given port name"""
         return self.port_items.get(port_name)
 
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasText():
-            event.acceptProposedAction()
-
-    def dragMoveEvent(self, event):
-        item = self.itemAt(event.position().toPoint())
-        if item and item != self.current_drag_highlight_item:
-            self.window().clear_drop_target_highlight(self)
-            self.window().highlight_drop_target_item(self, item)
-            self.current_drag_highlight_item = item
-        elif not item:
-            self.window().clear_drop_target_highlight(self)
-            self.current_drag_highlight_item = None
-        super().dragMoveEvent(event)
-
     def dragLeaveEvent(self, event):
         self.window().clear_drop_target_highlight(self)
         self.current_drag_highlight_item = None
@@ -701,34 +894,39 @@ class PortTreeWidget(QTreeWidget):
     def startDrag(self, supportedActions=None):
         """Start drag operation, setting the correct port role based on self.port_role."""
         # --- Create Mime Data ---
-        selected_items = self.selectedItems()
-        if not selected_items or not self.initialSelection: # Ensure drag was initiated properly
+        if not self.initialSelection: # Ensure drag was initiated properly
              return
 
-        port_items = [item for item in selected_items if item.childCount() == 0]
-        group_items = [item for item in selected_items if item.childCount() > 0]
+        # One pass over the selection, reading each port's name only once
+        port_names = []
+        group_items = []
+        for item in self.selectedItems():
+            if item.childCount() == 0:
+                port_name = item.text(0)
+                if port_name:
+                    port_names.append(port_name)
+            else:
+                group_items.append(item)
+        if not port_names and not group_items:
+            return
 
         mime_data = QMimeData()
         drag_text = ""
         port_role_bytes = self.port_role.encode('utf-8') # Use self.port_role
 
-        if len(port_items) > 1:
-            port_names = [item.data(0, Qt.ItemDataRole.UserRole) for item in port_items if item.data(0, Qt.ItemDataRole.UserRole)]
-            if not port_names: return
+        if len(port_names) > 1:
             mime_data.setData("application/x-port-list", b"true")
             mime_data.setData("application/x-port-role", port_role_bytes)
             mime_data.setText('\n'.join(port_names))
             drag_text = f"{len(port_names)} {self.port_role.capitalize()} Ports"
 
-        elif len(port_items) == 1 and not group_items:
-            item = port_items[0]
-            port_name = item.data(0, Qt.ItemDataRole.UserRole)
-            if not port_name: return
+        elif len(port_names) == 1 and not group_items:
+            port_name = port_names[0]
             mime_data.setData("application/x-port-role", port_role_bytes)
             mime_data.setText(port_name)
-            drag_text = item.text(0)
+            drag_text = port_name # Port items show their full name
 
-        elif len(group_items) == 1 and not port_items:
+        elif len(group_items) == 1 and not port_names:
             item = group_items[0]
             group_name = item.text(0)
             port_list = self.window()._get_ports_in_group(item)
@@ -748,17 +946,9 @@ class PortTreeWidget(QTreeWidget):
         drag = QDrag(self)
         drag.setMimeData(mime_data)
 
-        # Create pixmap (same as before)
-        font_metrics = QFontMetrics(self.font())
-        text_width = font_metrics.horizontalAdvance(drag_text) + 10
-        pixmap_width = max(70, text_width)
-        pixmap = QPixmap(pixmap_width, 20)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setPen(self.palette().color(QPalette.ColorRole.Text))
-        elided_text = font_metrics.elidedText(drag_text, Qt.TextElideMode.ElideRight, pixmap_width)
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, elided_text)
-        painter.end()
+        # Create pixmap, cached per text, palette color and font
+        pixmap = _render_drag_pixmap(drag_text, self.palette().color(QPalette.ColorRole.Text).rgba(),
+                                     self.font().toString())
 
         drag.setPixmap(pixmap)
         drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
@@ -766,68 +956,53 @@ class PortTreeWidget(QTreeWidget):
         result = drag.exec(Qt.DropAction.CopyAction)
         self.initialSelection = None # Clear selection after drag finishes
 
+    def _accepts_drag(self, mime_data):
+        """Whether dragged mime data carries ports from the opposite tree."""
+        # A missing format reads as empty data, which never matches a role
+        if mime_data.data("application/x-port-role") != self.drag_source_role:
+            return False
+        # Single ports only carry text, lists and groups carry their marker format as well
+        return (mime_data.hasText() or mime_data.hasFormat("application/x-port-list")
+                or mime_data.hasFormat("application/x-port-group"))
+
     def dragEnterEvent(self, event):
         """Accept drops only if the source role is the opposite of this tree's role."""
-        mime_data = event.mimeData()
-        has_role = mime_data.hasFormat("application/x-port-role")
-        has_list = mime_data.hasFormat("application/x-port-list")
-        has_group = mime_data.hasFormat("application/x-port-group")
-
-        if has_role and (has_list or has_group or mime_data.hasText()): # Check text for single port drag
-            source_role_bytes = mime_data.data("application/x-port-role")
-            # Determine the expected opposite role
-            expected_source_role = b"input" if self.port_role == 'output' else b"output"
-
-            # Accept if the source role is the expected opposite role
-            if source_role_bytes == expected_source_role:
-                event.acceptProposedAction()
-                return
-
-        event.ignore()
+        # The mime data can't change during a drag, so move and drop events reuse this check
+        self._drag_accepted = self._accepts_drag(event.mimeData())
+        if self._drag_accepted:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
 
     def dragMoveEvent(self, event):
         """Provide visual feedback during drag, accepting if roles are compatible."""
-        mime_data = event.mimeData()
-        has_role = mime_data.hasFormat("application/x-port-role")
-        has_list = mime_data.hasFormat("application/x-port-list")
-        has_group = mime_data.hasFormat("application/x-port-group")
-
-        # Check if it's a valid drag type with the correct opposite role
-        valid_drag = False
-        if has_role and (has_list or has_group or mime_data.hasText()): # Check text for single port drag
-            source_role_bytes = mime_data.data("application/x-port-role")
-            expected_source_role = b"input" if self.port_role == 'output' else b"output"
-            if source_role_bytes == expected_source_role: # Opposite role check
-                valid_drag = True
-
+        valid_drag = self._drag_accepted
         target_item = self.itemAt(event.position().toPoint())
+        manager = self.window() # Looked up once per event, not once per call below
 
         if valid_drag and target_item:
             # Valid drag over a potential target item
             if target_item != self.current_drag_highlight_item:
-                self.window().clear_drop_target_highlight(self)
-                self.window().highlight_drop_target_item(self, target_item)
+                manager.clear_drop_target_highlight(self)
+                manager.highlight_drop_target_item(self, target_item)
                 self.current_drag_highlight_item = target_item
             event.acceptProposedAction()
         else:
             # Invalid drag type, wrong role, or not over an item
             if self.current_drag_highlight_item:
-                self.window().clear_drop_target_highlight(self)
+                manager.clear_drop_target_highlight(self)
                 self.current_drag_highlight_item = None
             event.ignore()
 
     def dropEvent(self, event):
         """Handle drop event, connecting source to target based on roles."""
         mime_data = event.mimeData()
-        has_role = mime_data.hasFormat("application/x-port-role")
-        has_list = mime_data.hasFormat("application/x-port-list")
-        has_group = mime_data.hasFormat("application/x-port-group")
+        manager = self.window()
 
-        # 1. Check validity (Source role must be opposite of target role)
-        expected_source_role = b"input" if self.port_role == 'output' else b"output"
-        if not (has_role and (has_list or has_group or mime_data.hasText()) and mime_data.data("application/x-port-role") == expected_source_role):
+        # 1. Check validity (Source role must be opposite of target role), as found on drag enter
+        if not self._drag_accepted:
             event.ignore()
-            self.window().clear_drop_target_highlight(self)
+            manager.clear_drop_target_highlight(self)
             self.current_drag_highlight_item = None
             return
 
@@ -835,26 +1010,26 @@ class PortTreeWidget(QTreeWidget):
         target_item = self.itemAt(event.position().toPoint())
         if not target_item:
             event.ignore() # Dropped outside an item
-            self.window().clear_drop_target_highlight(self)
+            manager.clear_drop_target_highlight(self)
             self.current_drag_highlight_item = None
             return
 
-        target_ports = self.window()._get_ports_in_group(target_item) # Handles both port and group items
+        target_ports = manager._get_ports_in_group(target_item) # Handles both port and group items
         if not target_ports:
             event.ignore() # Target item has no associated ports
-            self.window().clear_drop_target_highlight(self)
+            manager.clear_drop_target_highlight(self)
             self.current_drag_highlight_item = None
             return
 
         # Store target identifier *before* connection/refresh
         target_is_group = target_item.childCount() > 0
-        target_identifier = target_item.text(0) if target_is_group else target_item.data(0, Qt.ItemDataRole.UserRole)
+        target_identifier = target_item.text(0) # Group name or full port name
 
         # 3. Get source ports (From mime data)
         source_ports = [port for port in mime_data.text().split('\n') if port]
         if not source_ports:
             event.ignore() # No source ports in mime data
-            self.window().clear_drop_target_highlight(self)
+            manager.clear_drop_target_highlight(self)
             self.current_drag_highlight_item = None
             return
 
@@ -862,16 +1037,16 @@ class PortTreeWidget(QTreeWidget):
         if self.port_role == 'output':
             # Target is Output tree, Source is Input
             print(f"Drop Event (Output Tree): Connecting Outputs(Target)={target_ports}, Inputs(Source)={source_ports}")
-            self.window().make_multiple_connections(target_ports, source_ports)
+            manager.make_multiple_connections(target_ports, source_ports)
         elif self.port_role == 'input':
             # Target is Input tree, Source is Output
             print(f"Drop Event (Input Tree): Connecting Outputs(Source)={source_ports}, Inputs(Target)={target_ports}")
-            self.window().make_multiple_connections(source_ports, target_ports)
+            manager.make_multiple_connections(source_ports, target_ports)
         else:
             # Should not happen
             print(f"Error: Unknown port_role '{self.port_role}' in dropEvent")
             event.ignore()
-            self.window().clear_drop_target_highlight(self)
+            manager.clear_drop_target_highlight(self)
             self.current_drag_highlight_item = None
             return
 
@@ -888,10 +1063,10 @@ class PortTreeWidget(QTreeWidget):
                         break
             else: # It was a port item
                 new_target_item = self.port_items.get(target_identifier)
-        if new_target_item:
+        if new_target_item and self.currentItem() is not new_target_item:
             self.setCurrentItem(new_target_item)
         # 5. Finalize
-        self.window().clear_drop_target_highlight(self)
+        manager.clear_drop_target_highlight(self)
         self.current_drag_highlight_item = None
 
 
@@ -914,27 +1089,72 @@ class ConnectionView(QGraphicsView):
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
         self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Repaint only the regions of changed connection paths, not the whole viewport
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
         self.refresh_timer = QTimer()
+        self._refresh_connection = None # Connection handle of the current timer callback
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.fitInView(self.scene().sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
 
-    def start_refresh_timer(self, callback, interval=1):
+    def start_refresh_timer(self, callback, interval=33):
         """Start the timer to refresh connections visualization"""
-        self.refresh_timer.timeout.connect(callback)
+        # Replace the previous callback so repeated starts don't stack connections
+        if self._refresh_connection is not None:
+            self.refresh_timer.timeout.disconnect(self._refresh_connection)
+        self._refresh_connection = self.refresh_timer.timeout.connect(callback)
         self.refresh_timer.start(interval)
 
     def stop_refresh_timer(self):
         """Stop the refresh timer"""
         self.refresh_timer.stop()
-        if self.refresh_timer.receivers(self.refresh_timer.timeout) > 0:
-            self.refresh_timer.timeout.disconnect()
+        if self._refresh_connection is not None:
+            self.refresh_timer.timeout.disconnect(self._refresh_connection)
+            self._refresh_connection = None
+
+
+class _SnapshotSignals(QObject):
+    """Carries the result of a _SnapshotJob back to the GUI thread."""
+    ready = pyqtSignal(bool, bool, list)  # is_midi, succeeded, [(output_name, input_name), ...]
+
+
+class _SnapshotJob(QRunnable):
+    """Collects the current JACK connections for one port type off the UI thread."""
+    def __init__(self, client, is_midi):
+        super().__init__()
+        self.setAutoDelete(False) # Lifetime is managed by JackConnectionManager
+        self.client = client
+        self.is_midi = is_midi
+        self.signals = _SnapshotSignals()
+
+    def run(self):
+        connections = []
+        succeeded = True
+        try:
+            ports = self.client.get_ports()
+            # Interned names make comparing with the last snapshot, and the drawn lines'
+            # keys, mostly identity checks; the names are the same every poll
+            intern = sys.intern
+            for output_port in ports:
+                if output_port.is_output and output_port.is_midi == self.is_midi:
+                    output_name = intern(output_port.name) # Read once, not once per connection
+                    for input_port in self.client.get_all_connections(output_port):
+                        if input_port.is_input and input_port.is_midi == self.is_midi:
+                            connections.append((output_name, intern(input_port.name)))
+        except jack.JackError as e:
+            print(f"Error getting connections: {e}")
+            succeeded = False
+        except Exception as e: # Never let an exception escape into the thread pool
+            print(f"Connection snapshot error: {type(e).__name__}: {e}")
+            succeeded = False
+        # Qt delivers this queued to the GUI thread, the emitting thread is a pool worker
+        self.signals.ready.emit(self.is_midi, succeeded, connections)
 
 
 class ConnectionHistory:
@@ -942,9 +1162,11 @@ class ConnectionHistory:
         self.history = []
         self.current_index = -1
 
-    def add_action(self, action, output_name, input_name):
-        self.history = self.history[:self.current_index + 1]
-        self.history.append((action, output_name, input_name))
+    def add_action(self, action, output_name, input_name, is_midi=False):
+        # Drop redo entries in place, nothing to do in the common case of no prior undo
+        if self.current_index + 1 != len(self.history):
+            del self.history[self.current_index + 1:]
+        self.history.append((action, output_name, input_name, is_midi))
         self.current_index += 1
 
     def can_undo(self):
@@ -955,9 +1177,9 @@ class ConnectionHistory:
 
     def undo(self):
         if self.can_undo():
-            action, output_name, input_name = self.history[self.current_index]
+            action, output_name, input_name, is_midi = self.history[self.current_index]
             self.current_index -= 1
-            return ('connect' if action == 'disconnect' else 'disconnect', output_name, input_name)
+            return ('connect' if action == 'disconnect' else 'disconnect', output_name, input_name, is_midi)
         return None
 
     def redo(self):
@@ -1024,7 +1246,6 @@ class TabUIManager:
         disconnect_button.setToolTip("Disconnect selected ports (D or Delete)") # Add tooltip
         # Presets button moved here from bottom layout
         presets_button = QPushButton("Presets")
-        presets_button.setStyleSheet(manager.button_stylesheet())
         presets_button.clicked.connect(manager.preset_handler._show_preset_menu) # Use PresetHandler
         # Refresh button created but not added here (moved to bottom)
         refresh_button = QPushButton('Refreh')
@@ -1066,16 +1287,15 @@ class TabUIManager:
             output_tree.itemClicked.connect(manager.on_output_clicked)
             connect_button.clicked.connect(manager.make_connection_selected)
             disconnect_button.clicked.connect(manager.break_connection_selected)
-            refresh_button.clicked.connect(manager.refresh_ports)
+            refresh_button.clicked.connect(lambda: manager.refresh_ports(resync=True))
             # Connect filter signals using instance attributes to a new handler
-            # Disconnect previous connections first to avoid duplicates if setup is called multiple times (unlikely but safe)
-            try: manager.input_filter_edit.textChanged.disconnect()
-            except TypeError: pass # No connection existed
-            try: manager.output_filter_edit.textChanged.disconnect()
-            except TypeError: pass # No connection existed
-
-            manager.input_filter_edit.textChanged.connect(manager._handle_filter_change)
-            manager.output_filter_edit.textChanged.connect(manager._handle_filter_change)
+            # Drop connections made by an earlier setup by handle, to avoid duplicates if setup is called multiple times (unlikely but safe)
+            for connection in manager._filter_connections:
+                QObject.disconnect(connection)
+            manager._filter_connections = [
+                manager.input_filter_edit.textChanged.connect(manager._filter_debounce.start),
+                manager.output_filter_edit.textChanged.connect(manager._filter_debounce.start),
+            ]
         elif port_type == 'midi':
             manager.midi_input_tree = input_tree
             manager.midi_output_tree = output_tree
@@ -1091,12 +1311,9 @@ class TabUIManager:
             output_tree.itemClicked.connect(manager.on_midi_output_clicked)
             connect_button.clicked.connect(manager.make_midi_connection_selected)
             disconnect_button.clicked.connect(manager.break_midi_connection_selected)
-            refresh_button.clicked.connect(manager.refresh_ports)
+            refresh_button.clicked.connect(lambda: manager.refresh_ports(resync=True))
             # Filter signals are connected in the 'audio' block to the shared handler
 
-        # Apply initial font size to the created trees
-        manager._apply_port_list_font_size()
-
     def setup_pwtop_tab(self, manager, tab_widget):
         """Set up the pw-top statistics tab"""
         layout = QVBoxLayout(tab_widget)
@@ -1319,7 +1536,7 @@ class LatencyTester:
             # Check if we are waiting for the connection signal
             if self.latency_waiting_for_connection:
                 # Check if any line contains a latency measurement
-                if re.search(r'\d+\.\d+\s+ms', data):
+                if _LATENCY_MS_RE.search(data):
                     self.latency_waiting_for_connection = False
                     self.manager.latency_results_text.setText("Connection detected. Running test...") # Changed message
                     # Start the timer now
@@ -1329,17 +1546,15 @@ class LatencyTester:
 
             # If not waiting (or connection just detected), parse for values
             if not self.latency_waiting_for_connection:
-                for line in data.splitlines():
-                    # Updated regex to capture both frames and ms
-                    match = re.search(r'(\d+\.\d+)\s+frames\s+(\d+\.\d+)\s+ms', line)
-                    if match:
-                        try:
-                            latency_frames = float(match.group(1))
-                            latency_ms = float(match.group(2))
-                            # Store both values as a tuple
-                            self.latency_values.append((latency_frames, latency_ms))
-                        except ValueError:
-                            pass # Ignore lines that don't parse correctly
+                # One scan over the whole chunk instead of splitting it into lines first
+                for match in _LATENCY_RESULT_RE.finditer(data):
+                    try:
+                        latency_frames = float(match.group(1))
+                        latency_ms = float(match.group(2))
+                        # Store both values as a tuple
+                        self.latency_values.append((latency_frames, latency_ms))
+                    except ValueError:
+                        pass # Ignore lines that don't parse correctly
 
     def stop_latency_test(self):
         """Stops the jack_delay process."""
@@ -1539,14 +1754,26 @@ class LatencyTester:
 
 
 # --- PwTop Monitor Class ---
+# pw-top header line, e.g. "S   ID  QUANT   RATE ... NAME". 'S' is also the state column of
+# suspended nodes, so ID must be the second column, not just appear somewhere in the line.
+_PWTOP_HEADER_RE = re.compile(rb'^S[ \t]+ID\b[^\n]*\bNAME\b', re.MULTILINE)
+
 class PwTopMonitor:
     def __init__(self, manager, pwtop_text_widget):
         self.manager = manager # Keep reference if needed, e.g., for flatpak_env
         self.pwtop_text = pwtop_text_widget
         self.pw_process = None
-        self.pwtop_buffer = ""
+        self.pwtop_buffer = bytearray()
+        self._pwtop_header_offsets = deque() # Byte offsets of header lines in pwtop_buffer
+        self._pwtop_scanned_upto = 0 # Buffer offset up to which complete lines were scanned
         self.last_complete_cycle = None
         self.flatpak_env = manager.flatpak_env # Store flatpak_env directly
+        # Coalesce display updates, pw-top can deliver several chunks per cycle
+        self._pwtop_dirty = False
+        self._pwtop_last_hash = 0 # Hash of the text currently shown in pwtop_text
+        self._pwtop_flush_timer = QTimer()
+        self._pwtop_flush_timer.setSingleShot(True)
+        self._pwtop_flush_timer.timeout.connect(self._flush_pwtop)
 
     def start(self):
         """Start the pw-top process in batch mode"""
@@ -1561,15 +1788,25 @@ class PwTopMonitor:
                 pw_top_path = shutil.which("pw-top")
                 if not pw_top_path:
                     self.pwtop_text.setText("Error: 'pw-top' command not found.\nPlease install pipewire-utils or equivalent.")
+                    self._pwtop_last_hash = 0 # Display no longer shows a cycle
                     self.pw_process = None # Ensure process is None if command not found
                     return
                 self.pw_process.setProgram(pw_top_path)
                 self.pw_process.setArguments(["-b"])
 
+            # Start from an empty buffer, a previous run may have left a partial cycle
+            self.pwtop_buffer = bytearray()
+            self._pwtop_header_offsets.clear()
+            self._pwtop_scanned_upto = 0
+
+            # stderr is never read here, forward it to the terminal instead of buffering it in QProcess.
+            # Merging it into stdout would put error text into the cycle parser.
+            self.pw_process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
             self.pw_process.readyReadStandardOutput.connect(self.handle_pwtop_output)
             self.pw_process.errorOccurred.connect(self.handle_pwtop_error)
             self.pw_process.finished.connect(self.handle_pwtop_finished)
-            self.pw_process.start()
+            # pw-top never reads stdin, so don't open a write channel for it
+            self.pw_process.start(QIODevice.OpenModeFlag.ReadOnly)
             print("PwTopMonitor: Started pw-top process.") # Added log
         else:
             print("PwTopMonitor: pw-top process already running.") # Added log
@@ -1583,7 +1820,6 @@ class PwTopMonitor:
             try:
                 self.pw_process.closeReadChannel(QProcess.ProcessChannel.StandardOutput)
                 self.pw_process.closeReadChannel(QProcess.ProcessChannel.StandardError)
-                self.pw_process.closeWriteChannel()
             except Exception as e:
                 print(f"PwTopMonitor: Error closing process channels: {e}")
 
@@ -1606,27 +1842,24 @@ class PwTopMonitor:
         """Handle new output from pw-top"""
         if self.pw_process is not None:
             try:
-                data = self.pw_process.readAllStandardOutput().data().decode()
+                data = self.pw_process.readAllStandardOutput().data()
                 if data:
-                    # Append new data to buffer
-                    self.pwtop_buffer += data
+                    # Append new data to buffer, decoding is left to the extracted cycle
+                    self.pwtop_buffer.extend(data)
 
                     # Extract complete cycle
                     complete_cycle = self.extract_latest_complete_cycle()
 
-                    # Update our stored complete cycle if we found a new one
-                    if complete_cycle:
+                    # Only schedule a display update when a new, different cycle arrived
+                    if complete_cycle and complete_cycle != self.last_complete_cycle:
                         self.last_complete_cycle = complete_cycle
+                        self._pwtop_dirty = True
+                        if not self._pwtop_flush_timer.isActive():
+                            self._pwtop_flush_timer.start(100) # At most ~10 display updates per second
 
-                    # Always display the latest known complete cycle
-                    if self.last_complete_cycle:
-                        self.pwtop_text.setText(self.last_complete_cycle)
-                        # Keep cursor at the top to maintain stable view
-                        self.pwtop_text.verticalScrollBar().setValue(0)
-
-                    # Limit buffer size to prevent memory issues
+                    # Limit buffer size to prevent memory issues (e.g. output without headers)
                     if len(self.pwtop_buffer) > 10000:
-                        self.pwtop_buffer = self.pwtop_buffer[-5000:]
+                        self._trim_pwtop_buffer(len(self.pwtop_buffer) - 5000)
             except Exception as e:
                 print(f"PwTopMonitor: Error handling pw-top output: {e}")
 
@@ -1642,6 +1875,7 @@ class PwTopMonitor:
         print(f"PwTopMonitor: pw-top process error: {error} - {error_string}")
         # Optionally display error in the text widget
         self.pwtop_text.append(f"\nError running pw-top: {error_string}")
+        self._pwtop_last_hash = 0 # Displayed text changed, next cycle must be written
 
 
     def handle_pwtop_finished(self, exit_code, exit_status):
@@ -1652,42 +1886,63 @@ class PwTopMonitor:
         # self.pwtop_text.append("\npw-top process finished.")
 
 
+    def _flush_pwtop(self):
+        """Show the latest complete cycle if it changed and the pw-top tab is visible."""
+        if not self._pwtop_dirty or not self.last_complete_cycle:
+            return
+        if self.manager.tab_widget.currentWidget() is not self.manager.pwtop_tab_widget:
+            return # Hidden tab, switch_tab flushes when it becomes visible
+        self._pwtop_dirty = False
+        cycle_hash = hash(self.last_complete_cycle)
+        if cycle_hash == self._pwtop_last_hash:
+            return # Same text already displayed, skip the document rebuild
+        self._pwtop_last_hash = cycle_hash
+        self.pwtop_text.setPlainText(self.last_complete_cycle) # No rich-text parsing needed
+        # Keep cursor at the top to maintain stable view
+        self.pwtop_text.verticalScrollBar().setValue(0)
+
+    def _trim_pwtop_buffer(self, cut):
+        """Drop the first cut bytes of the buffer, keeping header offsets in step."""
+        if cut <= 0:
+            return
+        if self._pwtop_scanned_upto < cut and self.pwtop_buffer[cut - 1] != ord('\n'):
+            # Cut lands mid-line in unscanned data, skip the partial line
+            newline = self.pwtop_buffer.find(b'\n', cut)
+            self._pwtop_scanned_upto = newline + 1 if newline != -1 else len(self.pwtop_buffer)
+        del self.pwtop_buffer[:cut]
+        while self._pwtop_header_offsets and self._pwtop_header_offsets[0] < cut:
+            self._pwtop_header_offsets.popleft()
+        for i in range(len(self._pwtop_header_offsets)):
+            self._pwtop_header_offsets[i] -= cut
+        self._pwtop_scanned_upto = max(0, self._pwtop_scanned_upto - cut)
+
     def extract_latest_complete_cycle(self):
         """Extract the latest complete cycle from the pw-top output buffer"""
-        lines = self.pwtop_buffer.split('\n')
-
-        # Find all lines that start with 'S' and contain 'ID' and 'NAME'
-        header_indices = [
-            i for i, line in enumerate(lines)
-            if line.startswith('S') and 'ID' in line and 'NAME' in line
-        ]
-
-        # Keep buffer size manageable by removing old data
-        if len(header_indices) > 2:
-            keep_from_line = header_indices[-2]  # Keep last 2 cycles
-            self.pwtop_buffer = '\n'.join(lines[keep_from_line:])
-            # Re-calculate header indices for the trimmed buffer
-            lines = self.pwtop_buffer.split('\n')
-            header_indices = [
-                i for i, line in enumerate(lines)
-                if line.startswith('S') and 'ID' in line and 'NAME' in line
-            ]
-
+        # Scan only the complete lines that arrived since the last call for header lines
+        # (lines that start with 'S' and contain 'ID' and 'NAME')
+        scan_end = self.pwtop_buffer.rfind(b'\n') + 1
+        if scan_end > self._pwtop_scanned_upto:
+            for match in _PWTOP_HEADER_RE.finditer(self.pwtop_buffer, self._pwtop_scanned_upto, scan_end):
+                self._pwtop_header_offsets.append(match.start())
+            self._pwtop_scanned_upto = scan_end
 
         # Need at least 2 headers to identify a complete cycle
-        if len(header_indices) < 2:
+        if len(self._pwtop_header_offsets) < 2:
             return None
 
         # Extract section between last two headers
-        start_idx = header_indices[-2]
-        end_idx = header_indices[-1]
-        section = lines[start_idx:end_idx]
+        start_idx = self._pwtop_header_offsets[-2]
+        end_idx = self._pwtop_header_offsets[-1]
+        section = bytes(self.pwtop_buffer[start_idx:end_idx])
+
+        # Older data is no longer needed, the newest header starts the next cycle
+        self._trim_pwtop_buffer(end_idx)
 
         # Basic validation - should have some minimum content
-        if len(section) < 3:
+        if section.count(b'\n') < 3:
             return None
 
-        return '\n'.join(section)
+        return section[:-1].decode(errors='replace')
 
 # --- End PwTop Monitor Class ---
 
@@ -1714,17 +1969,8 @@ class PresetHandler:
         self._preset_menu_name_edit.setPlaceholderText("Enter New Preset Name...")
         self._preset_menu_name_edit.returnPressed.connect(self._save_current_preset_from_menu) # Connect Enter key
         self._preset_menu_name_edit.setMinimumWidth(200) # Give it some space
-        # Apply similar styling as filter edits
-        filter_style = f"""
-            QLineEdit {{
-                background-color: {self.manager.background_color.name()};
-                color: {self.manager.text_color.name()};
-                border: 1px solid {self.manager.text_color.name()};
-                padding: 2px;
-                border-radius: 3px;
-            }}
-        """
-        self._preset_menu_name_edit.setStyleSheet(filter_style)
+        # Apply the same styling as the filter edits
+        self._preset_menu_name_edit.setStyleSheet(self.manager.line_edit_stylesheet())
 
         name_action = QWidgetAction(menu)
         name_action.setDefaultWidget(self._preset_menu_name_edit)
@@ -2119,10 +2365,14 @@ class PresetHandler:
 
 
 class JackConnectionManager(QMainWindow):
-    # PyQt signals for port registration events
-    port_registered = pyqtSignal(str, bool)  # port name, is_input
-    port_unregistered = pyqtSignal(str, bool)  # port name, is_input
+    # PyQt signal for port registration events, emitted once per burst from JACK's thread
+    port_events_pending = pyqtSignal()
+    connections_changed = pyqtSignal() # Emitted from JACK's thread on any (dis)connection
     untangle_mode_changed = pyqtSignal(int) # Signal for mode change
+    PORT_EVENT_BATCH_LIMIT = 32 # Above this many queued port events per type, rebuild the trees instead
+    PORT_RESYNC_INTERVAL_MS = 2000 # How often auto refresh checks the port name cache against JACK
+    PORT_EVENT_MAX_DELAY_MS = 250 # Longest a queued port event waits while more keep arriving
+    CONNECTION_STYLE_CACHE_LIMIT = 512 # Client names with a cached line color/pen
 
     def __init__(self):
         super().__init__()
@@ -2145,6 +2395,12 @@ class JackConnectionManager(QMainWindow):
         self.connections = set()
         self.connection_colors = {}
         self.connection_history = ConnectionHistory()
+        self._connection_snapshots = {False: None, True: None} # Last good snapshot per port type (is_midi)
+        self._connection_index = {False: None, True: None} # Highlight lookups, see _get_connection_index
+        self._path_items = {False: {}, True: {}} # Drawn line per (output, input), reused across redraws
+        self._last_draw_sig = {False: None, True: None} # What the current lines were drawn from, see _get_draw_signature
+        self._fitted_scene_rects = {False: None, True: None} # Scene rect each view was last fitted to
+        self._snapshot_jobs = {} # In-flight _SnapshotJob per port type
         # self.untangle_enabled removed, using self.untangle_mode initialized earlier
         self.dark_mode = self.is_dark_mode()
         self.setup_colors()
@@ -2165,13 +2421,57 @@ class JackConnectionManager(QMainWindow):
         self.input_filter_edit.setPlaceholderText("Filter inputs...")
         self.input_filter_edit.setToolTip("Use '-' prefix for exclusive filtering")
         # Removed redundant MIDI filter edits - use the main ones above
+        # Filter only once typing pauses, not on every keystroke
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(200)
+        self._filter_debounce.timeout.connect(self._handle_filter_change)
+        self._filter_connections = [] # textChanged connection handles, see TabUIManager.setup_port_tab
+        # Redraw connection lines once a window resize settles, not for every intermediate size
+        self._resize_redraw_timer = QTimer(self)
+        self._resize_redraw_timer.setSingleShot(True)
+        self._resize_redraw_timer.setInterval(50)
+        self._resize_redraw_timer.timeout.connect(self.refresh_visualizations)
 
         # Set up JACK port registration callbacks
         self.client.set_port_registration_callback(self._handle_port_registration)
+        # Any connection change, ours or another client's, makes the highlight index stale.
+        # The queued signal lands after whatever the GUI thread is doing, so an index built
+        # from data read before the change is always dropped afterwards
+        self.client.set_port_connect_callback(lambda a, b, connect: self.connections_changed.emit())
+        # Both signals are emitted from JACK's thread; queue them so the slots always run on the Qt thread
+        self.connections_changed.connect(self.invalidate_connection_index, Qt.ConnectionType.QueuedConnection)
 
         # Connect signals to refresh methods
-        self.port_registered.connect(self._on_port_registered)
-        self.port_unregistered.connect(self._on_port_unregistered)
+        # Port names per (is_midi, is_input), seeded from JACK once and then kept current by the
+        # registration callbacks, so refreshes don't need to query JACK
+        self._port_names = {}
+        self._sorted_port_names = {}
+        # Port types ('audio'/'midi') whose trees have been populated. After startup the
+        # other type's trees are only built when its tab is first shown
+        self._built_port_types = set()
+        self._startup_refreshed = False
+        # Port (un)registrations are applied incrementally, in batches
+        self._pending_port_events = []
+        self._port_event_timer = QTimer()
+        self._port_event_timer.setSingleShot(True)
+        self._port_event_timer.timeout.connect(self._apply_port_events)
+        # Caps how long a continuous storm of events can keep restarting the timer above
+        self._port_event_deadline = QTimer()
+        self._port_event_deadline.setSingleShot(True)
+        self._port_event_deadline.timeout.connect(self._apply_port_events)
+        # Registration callbacks can be missed or misreport a port's type, so while auto
+        # refresh is on the cache is periodically compared with what JACK reports
+        self._port_resync_timer = QTimer()
+        self._port_resync_timer.setInterval(self.PORT_RESYNC_INTERVAL_MS)
+        self._port_resync_timer.timeout.connect(self._resync_port_cache)
+        # Filled by the JACK thread, drained on the Qt thread. Only the first event of
+        # a burst emits port_events_pending, the rest just append
+        self._jack_port_events = []
+        self._jack_port_events_lock = threading.Lock()
+        self._jack_port_drain_pending = False
+        self._jack_port_resync_needed = False # Set when a port's type couldn't be read
+        self.port_events_pending.connect(self._drain_jack_port_events, Qt.ConnectionType.QueuedConnection)
 
         # Detect Flatpak environment
         self.flatpak_env = os.path.exists('/.flatpak-info')
@@ -2207,6 +2507,14 @@ class JackConnectionManager(QMainWindow):
         self.tab_ui_manager.setup_pwtop_tab(self, self.pwtop_tab_widget)
         self.tab_ui_manager.setup_latency_tab(self, self.latency_tab_widget) # Added call to setup latency tab
 
+        # The four port trees exist from here on; keep them in one list so
+        # bulk operations don't need to probe for each attribute.
+        self._all_trees = (self.output_tree, self.input_tree,
+                           self.midi_output_tree, self.midi_input_tree)
+        self._apply_port_list_font_size() # Initial font size, once all four trees exist
+        # Filled by setup_bottom_layout, which runs after the first switch_tab
+        self._bottom_controls = []
+
         self.tab_widget.addTab(self.audio_tab_widget, "Audio")
         self.tab_widget.addTab(self.midi_tab_widget, "MIDI")
         self.tab_widget.addTab(self.pwtop_tab_widget, "pw-top")
@@ -2223,19 +2531,11 @@ class JackConnectionManager(QMainWindow):
 
         self.setup_bottom_layout(main_layout) # <-- Preset button will be added here later
 
-        # Initialize the startup refresh timer
-        self.startup_refresh_timer = QTimer()
-        self.startup_refresh_timer.timeout.connect(self.startup_refresh)
-        self.startup_refresh_count = 0
-
         # Visualization refresh timers will be started conditionally later based on config
 
-        # Activate JACK client and start refresh sequence
+        # Activate JACK client, the startup refresh is triggered in main()
         self.client.activate()
 
-        # Start the rapid refresh sequence immediately
-        # self.start_startup_refresh() # Don't start automatically, will be triggered in main()
-
         # Define actions first
         self._setup_actions()
         # Then add them via setup_shortcuts
@@ -2246,39 +2546,27 @@ class JackConnectionManager(QMainWindow):
             self.save_preset_action.setEnabled(bool(self.preset_handler.current_preset_name))
 
     def start_startup_refresh(self):
-        """Start the rapid refresh sequence on startup"""
-        self.startup_refresh_count = 0
-        self.startup_refresh_timer.start(1)  # 1ms interval
+        """Populate the port lists once the event loop is running"""
+        # Deferred so the window is shown first and the trees and lines land in the first paint.
+        # Ports registered meanwhile only update the cache, see _apply_port_events
+        QTimer.singleShot(0, self.startup_refresh)
+        QTimer.singleShot(0, self._finalize_startup)
 
     def startup_refresh(self):
-        """Handle the rapid refresh sequence"""
-        # Remember original port type
-        original_port_type = self.port_type
-
-        # First refresh audio ports
-        self.port_type = 'audio'
-        self.refresh_ports()
-
-        # Then refresh MIDI ports
-        self.port_type = 'midi'
+        """Refresh the current tab's ports and view, the other port type waits for its tab"""
+        # port_type is still 'audio' when starting on the pw-top or latency tab
         self.refresh_ports()
-
-        # Restore original port type
-        self.port_type = original_port_type
+        self._startup_refreshed = True
 
         # Update current tab's view
         self.refresh_visualizations()
 
-        # Increment counter and stop timer if done
-        self.startup_refresh_count += 1
-        if self.startup_refresh_count >= 3:
-            self.startup_refresh_timer.stop()
-
-            # Apply collapse state after startup refresh is complete
-            if hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked():
-                self.apply_collapse_state_to_all_trees()
+    def _finalize_startup(self):
+        """Apply collapse state once the startup refresh is complete"""
+        if hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked():
+            self.apply_collapse_state_to_all_trees()
 
-            # Preset loading is now handled exclusively in main() for headless mode
+        # Preset loading is now handled exclusively in main() for headless mode
 
     # Removed setup_port_tab (moved to TabUIManager)
     # pw-top methods moved to PwTopMonitor class
@@ -2318,16 +2606,8 @@ class JackConnectionManager(QMainWindow):
             button.setStyleSheet(self.button_stylesheet())
             button.setEnabled(False)
 
-        # Define style for filter edits
-        filter_style = f"""
-            QLineEdit {{
-                background-color: {self.background_color.name()};
-                color: {self.text_color.name()};
-                border: 1px solid {self.text_color.name()};
-                padding: 2px;
-                border-radius: 3px;
-            }}
-        """
+        # Style for filter edits
+        filter_style = self.line_edit_stylesheet()
         # Use the filter edits created in setup_port_tab
         # Apply style and fixed width
         if hasattr(self, 'output_filter_edit'):
@@ -2345,7 +2625,7 @@ class JackConnectionManager(QMainWindow):
         self.bottom_refresh_button.setToolTip("Refresh port list (R)") # Add tooltip
         self.bottom_refresh_button.setStyleSheet(self.button_stylesheet())
         # refresh_ports already handles audio/midi based on self.port_type
-        self.bottom_refresh_button.clicked.connect(self.refresh_ports)
+        self.bottom_refresh_button.clicked.connect(lambda: self.refresh_ports(resync=True))
 
         # Add widgets in the new order: Collapse All, Auto Refresh, Refresh, Undo, Redo
         # --- Untangle Cycle Button ---
@@ -2395,6 +2675,15 @@ class JackConnectionManager(QMainWindow):
         self.undo_button.clicked.connect(self.undo_action)
         self.redo_button.clicked.connect(self.redo_action)
 
+        # Controls that are only meaningful on the port tabs, toggled as a group
+        self._bottom_controls = [
+            self.auto_refresh_checkbox, self.untangle_button,
+            self.collapse_all_checkbox, self.bottom_refresh_button,
+            self.undo_button, self.redo_button,
+            self.output_filter_edit, self.input_filter_edit,
+            self.zoom_in_button, self.zoom_out_button,
+        ]
+
         # Initialize callback state from config
         self.callbacks_enabled = auto_refresh_enabled
 
@@ -2404,34 +2693,23 @@ class JackConnectionManager(QMainWindow):
         self.show_bottom_controls(current_tab < 2) # Preset button visibility handled here too
         # Start visualization timers if auto-refresh is enabled in config
         if auto_refresh_enabled:
-            # Ensure 8-space indentation for lines inside 'if'
-            self.connection_view.start_refresh_timer(self.refresh_visualizations)
-            self.midi_connection_view.start_refresh_timer(self.refresh_visualizations)
+            # Each view's timer redraws only its own scene; refresh_visualizations
+            # on both would draw the visible tab twice per tick
+            self.connection_view.start_refresh_timer(self.update_connections)
+            self.midi_connection_view.start_refresh_timer(self.update_midi_connections)
+            self._port_resync_timer.start()
 
         # Ensure 4-space indentation for the print statement (same level as 'if')
     # Add new method to apply collapse state to all trees
     def apply_collapse_state_to_all_trees(self):
         """Apply the current collapse state to all port trees"""
-        if hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked():
-            # Collapse all trees regardless of current tab
-            if hasattr(self, 'input_tree'):
-                self.input_tree.collapseAllGroups()
-            if hasattr(self, 'output_tree'):
-                self.output_tree.collapseAllGroups()
-            if hasattr(self, 'midi_input_tree'):
-                self.midi_input_tree.collapseAllGroups()
-            if hasattr(self, 'midi_output_tree'):
-                self.midi_output_tree.collapseAllGroups()
-        else:
-            # Expand all trees
-            if hasattr(self, 'input_tree'):
-                self.input_tree.expandAllGroups()
-            if hasattr(self, 'output_tree'):
-                self.output_tree.expandAllGroups()
-            if hasattr(self, 'midi_input_tree'):
-                self.midi_input_tree.expandAllGroups()
-            if hasattr(self, 'midi_output_tree'):
-                self.midi_output_tree.expandAllGroups()
+        # The first switch_tab runs before the bottom bar (and checkbox) exist
+        collapse = hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked()
+        for tree in self._all_trees:
+            if collapse:
+                tree.collapseAllGroups()
+            else:
+                tree.expandAllGroups()
 
         # Update visualizations
         self.refresh_visualizations()
@@ -2439,6 +2717,9 @@ class JackConnectionManager(QMainWindow):
     def toggle_collapse_all(self, state):
         """Handle collapse all toggle state change"""
         is_checked = int(state) == 2  # Qt.CheckState.Checked equals 2
+        # The saved setting is the state the trees were last put in
+        if is_checked == self.config_manager.get_bool('collapse_all_enabled', False):
+            return
 
         # Apply to all trees
         self.apply_collapse_state_to_all_trees()
@@ -2448,19 +2729,22 @@ class JackConnectionManager(QMainWindow):
 
     def switch_tab(self, index):
         # Stop pw-top monitor if switching away from it
-        if index != 2 and hasattr(self, 'pwtop_monitor') and self.pwtop_monitor is not None:
+        if index != 2 and self.pwtop_monitor is not None:
              self.pwtop_monitor.stop()
         
         # Configure based on the new tab index
         if index < 2:  # Audio or MIDI tabs
             self.port_type = 'audio' if index == 0 else 'midi'
+            if self._startup_refreshed and self.port_type not in self._built_port_types:
+                self._refresh_single_port_type(self.port_type) # First visit builds the trees
             self.apply_collapse_state_to_all_trees()
             self.refresh_visualizations()
             self.show_bottom_controls(True) # Show controls
         elif index == 2:  # pw-top tab
             # Start pw-top monitor only when switching to this tab
-            if hasattr(self, 'pwtop_monitor') and self.pwtop_monitor is not None:
+            if self.pwtop_monitor is not None:
                 self.pwtop_monitor.start()
+                self.pwtop_monitor._flush_pwtop() # Show any cycle that arrived while hidden
             self.show_bottom_controls(False) # Hide controls
         elif index == 3: # jack_delay tab
             # No specific process to start here, just hide controls
@@ -2477,29 +2761,8 @@ class JackConnectionManager(QMainWindow):
         """Show or hide bottom controls based on active tab"""
         # Presets button is now part of the port tab layout, not the bottom layout.
         # Its visibility is handled by the tab switching itself.
-        if hasattr(self, 'auto_refresh_checkbox'):
-            self.auto_refresh_checkbox.setVisible(visible)
-            # Use the new button name here
-            if hasattr(self, 'untangle_button'): # Add check for safety
-                self.untangle_button.setVisible(visible)
-        if hasattr(self, 'collapse_all_checkbox'):
-            self.collapse_all_checkbox.setVisible(visible)
-        # Show/hide the new bottom refresh button
-        if hasattr(self, 'bottom_refresh_button'):
-            self.bottom_refresh_button.setVisible(visible)
-        if hasattr(self, 'undo_button'):
-            self.undo_button.setVisible(visible)
-        if hasattr(self, 'redo_button'):
-            self.redo_button.setVisible(visible)
-        # Also show/hide the filter edits and zoom buttons
-        if hasattr(self, 'output_filter_edit'):
-            self.output_filter_edit.setVisible(visible)
-        if hasattr(self, 'input_filter_edit'):
-            self.input_filter_edit.setVisible(visible)
-        if hasattr(self, 'zoom_in_button'):
-            self.zoom_in_button.setVisible(visible)
-        if hasattr(self, 'zoom_out_button'):
-            self.zoom_out_button.setVisible(visible)
+        for widget in self._bottom_controls:
+            widget.setVisible(visible)
 
 
     def _handle_port_registration(self, port, register: bool):
@@ -2509,79 +2772,165 @@ class JackConnectionManager(QMainWindow):
             if port is None:
                 return
 
-            # Check if the port object has the required attributes before accessing them
-            # This will avoid the AssertionError in jack.py's _wrap_port_ptr
-            port_name = None
-            is_input = False
+            # Read each attribute once. hasattr() would evaluate these cffi-backed properties
+            # too, doubling the work done on JACK's thread. A port that can't report its name
+            # (e.g. the AssertionError from jack.py's _wrap_port_ptr) is skipped.
+            try:
+                port_name = port.name
+            except Exception:
+                return
+            if not isinstance(port_name, str) or not port_name:
+                return
 
-            # Use hasattr checks first to avoid triggering AttributeErrors
-            if hasattr(port, 'name'):
-                try:
-                    port_name = port.name
-                    # Only proceed if we got a valid port name
-                    if not isinstance(port_name, str) or not port_name:
-                        return
-                except Exception:
-                    return
+            try:
+                is_input = port.is_input
+            except Exception:
+                is_input = False # Default to False if we can't determine input status
 
-            if hasattr(port, 'is_input'):
-                try:
-                    is_input = port.is_input
-                except Exception:
-                    # Default to False if we can't determine input status
-                    is_input = False
-
-            # Only emit signals if we successfully obtained port information
-            if port_name:
-                if register:
-                    self.port_registered.emit(port_name, is_input)
-                else:
-                    self.port_unregistered.emit(port_name, is_input)
+            resync = False
+            try:
+                is_midi = port.is_midi
+            except Exception:
+                is_midi = False
+                resync = True # Possibly filed under the wrong type, re-read the lists from JACK
+
+            with self._jack_port_events_lock:
+                self._jack_port_events.append((register, port_name, is_input, is_midi))
+                self._jack_port_resync_needed = self._jack_port_resync_needed or resync
+                notify = not self._jack_port_drain_pending
+                self._jack_port_drain_pending = True
+            if notify:
+                self.port_events_pending.emit()
         except Exception as e:
             # Log any errors since this runs in a callback
             print(f"Port registration callback error: {type(e).__name__}: {e}")
 
-    def _on_port_registered(self, port_name: str, is_input: bool):
+    def _drain_jack_port_events(self):
+        """Take every port event the JACK thread has collected and handle them in order"""
+        with self._jack_port_events_lock:
+            events, self._jack_port_events = self._jack_port_events, []
+            self._jack_port_drain_pending = False
+            resync, self._jack_port_resync_needed = self._jack_port_resync_needed, False
+        for register, port_name, is_input, is_midi in events:
+            if register:
+                self._on_port_registered(port_name, is_input, is_midi)
+            else:
+                self._on_port_unregistered(port_name, is_input, is_midi)
+        if resync:
+            self._resync_port_cache()
+
+    def _on_port_registered(self, port_name: str, is_input: bool, is_midi: bool):
         """Handle port registration events in the Qt main thread"""
+        self._update_port_name_cache(True, port_name, is_input, is_midi) # Even with auto refresh off
         if not self.callbacks_enabled:
             return
 
 
         # Check if this is a jack_delay port registration, and if so, attempt auto-connection via LatencyTester
-        if (hasattr(self, 'latency_tester') and self.latency_tester is not None and
+        if (self.latency_tester is not None and
             (port_name == "jack_delay:in" or port_name == "jack_delay:out")):
             print(f"Detected registration of {port_name}, attempting latency auto-connection via LatencyTester...")
             # Use QTimer.singleShot to slightly delay the connection attempt,
             # ensuring both jack_delay ports might be ready.
             QTimer.singleShot(50, self.latency_tester._attempt_latency_auto_connection) # 50ms delay
 
-        self.refresh_ports(refresh_all=True)
+        self._queue_port_event(True, port_name, is_input, is_midi)
 
 
-    def _on_port_unregistered(self, port_name: str, is_input: bool):
+    def _on_port_unregistered(self, port_name: str, is_input: bool, is_midi: bool):
         """Handle port unregistration events in the Qt main thread"""
+        self._update_port_name_cache(False, port_name, is_input, is_midi)
+        self.invalidate_connection_index() # Its connections went with it
         if not self.callbacks_enabled:
             return
-        
-        self.refresh_ports(refresh_all=True)
+
+        self._queue_port_event(False, port_name, is_input, is_midi)
+
+    def _queue_port_event(self, register, port_name, is_input, is_midi):
+        """Collect port (un)registrations so a burst is applied in one pass"""
+        if not self._pending_port_events:
+            self._port_event_deadline.start(self.PORT_EVENT_MAX_DELAY_MS) # Not restarted by later events
+        self._pending_port_events.append((register, port_name, is_input, is_midi))
+        # Restart on every event so a whole burst (e.g. a client registering all its ports) lands in one pass
+        self._port_event_timer.start(50)
+
+    def _apply_port_events(self):
+        """Apply queued port events to the trees, falling back to a full refresh for large bursts"""
+        self._port_event_timer.stop()
+        self._port_event_deadline.stop()
+        events = self._pending_port_events
+        self._pending_port_events = []
+        collapsed = hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked()
+        resynced = False
+
+        for port_type, is_midi in (('audio', False), ('midi', True)):
+            # Unregistered ports may not report their type reliably, so removals are checked on both types
+            if port_type not in self._built_port_types:
+                continue # Built from the port name cache when its tab is first shown
+            type_events = [e for e in events if e[3] == is_midi or not e[0]]
+            if not type_events:
+                continue
+            if len(type_events) > self.PORT_EVENT_BATCH_LIMIT:
+                # A storm this size is where callbacks get lost, so re-read JACK (once) as well
+                self._refresh_single_port_type(port_type, resync=not resynced)
+                resynced = True
+                continue
+
+            if is_midi:
+                input_tree, output_tree = self.midi_input_tree, self.midi_output_tree
+            else:
+                input_tree, output_tree = self.input_tree, self.output_tree
+            changed = False
+            # addPort/removePort keep updates off if the caller already did, so the batch repaints once
+            for tree in (input_tree, output_tree):
+                tree.setUpdatesEnabled(False)
+            try:
+                for register, port_name, is_input, _ in type_events:
+                    tree = input_tree if is_input else output_tree
+                    if register:
+                        if port_name not in tree.port_items:
+                            tree.addPort(port_name, expanded=not collapsed)
+                            changed = True
+                    else:
+                        changed = tree.removePort(port_name) or changed
+            finally:
+                for tree in (input_tree, output_tree):
+                    tree.setUpdatesEnabled(True)
+            if not changed:
+                continue
+
+            # Re-apply filters so new ports respect them, then update lines and buttons
+            self.filter_ports(input_tree, self.input_filter_edit.text(), refresh=False)
+            self.filter_ports(output_tree, self.output_filter_edit.text(), refresh=False)
+            if is_midi:
+                self.update_midi_connections()
+                self.update_midi_connection_buttons()
+            else:
+                self.update_connections()
+                self.update_connection_buttons()
 
     def toggle_auto_refresh(self, state):
         is_checked = int(state) == 2  # Qt.CheckState.Checked equals 2
+        if is_checked == self.callbacks_enabled:
+            return # Nothing to start or stop
         self.callbacks_enabled = is_checked
 
         # Start/stop and adjust visualization timers based on state and focus
         if is_checked:
             # Ensure timers are started (start_refresh_timer handles multiple calls safely)
-            # The default interval in start_refresh_timer should be 1ms
             # print("DEBUG: Starting timers in toggle_auto_refresh") # Add log
-            self.connection_view.start_refresh_timer(self.refresh_visualizations, interval=1)
-            self.midi_connection_view.start_refresh_timer(self.refresh_visualizations, interval=1)
+            self.connection_view.start_refresh_timer(self.update_connections)
+            self.midi_connection_view.start_refresh_timer(self.update_midi_connections)
+            self._port_resync_timer.start()
+            # Catch up on whatever the cache missed while auto refresh was off
+            self._resync_port_cache()
             # Set the correct interval based on current focus
             # print("DEBUG: Calling _update_refresh_timer_interval from toggle_auto_refresh") # Add log
             self._update_refresh_timer_interval()
         else:
             self.connection_view.stop_refresh_timer()
             self.midi_connection_view.stop_refresh_timer()
+            self._port_resync_timer.stop()
 
         # Save state to config
         self.config_manager.set_bool('auto_refresh_enabled', is_checked)
@@ -2596,7 +2945,7 @@ class JackConnectionManager(QMainWindow):
                 # Window is focused, check the active tab
                 current_index = self.tab_widget.currentIndex()
                 if current_index == 0 or current_index == 1:  # Audio or MIDI tab
-                    interval = 5
+                    interval = 33 # ~30 fps, faster only redraws identical frames
                 elif current_index == 2 or current_index == 3:  # pw-top or Latency Test tab
                     interval = 100
                 else:
@@ -2606,10 +2955,10 @@ class JackConnectionManager(QMainWindow):
 
             # print(f"DEBUG: Setting refresh interval to {interval}ms (Focused: {self.is_focused}, Tab: {self.tab_widget.currentIndex()})") # Optional debug log
             try:
-                # Check if timers exist and are active before setting interval
-                if hasattr(self.connection_view, 'refresh_timer') and self.connection_view.refresh_timer.isActive():
+                # Only adjust timers that are running; the views may not exist yet during __init__
+                if self.connection_view.refresh_timer.isActive():
                     self.connection_view.refresh_timer.setInterval(interval)
-                if hasattr(self.midi_connection_view, 'refresh_timer') and self.midi_connection_view.refresh_timer.isActive():
+                if self.midi_connection_view.refresh_timer.isActive():
                     self.midi_connection_view.refresh_timer.setInterval(interval)
             except AttributeError as e:
                  print(f"Warning: Could not access refresh_timer: {e}") # Handle cases where views might not be fully initialized
@@ -2621,6 +2970,12 @@ class JackConnectionManager(QMainWindow):
             self.is_focused = self.isActiveWindow()
             # print(f"DEBUG: ActivationChange detected - isActiveWindow: {self.is_focused}") # Add log
             self._update_refresh_timer_interval()
+        elif event.type() == event.Type.WindowStateChange and self.pwtop_monitor is not None:
+            # Nothing shows pw-top output while minimized, pause the process until restored
+            if self.isMinimized():
+                self.pwtop_monitor.stop()
+            elif self.tab_widget.currentWidget() is self.pwtop_tab_widget:
+                self.pwtop_monitor.start()
     # --- End Focus Handling --- (Replaced focusIn/OutEvent with changeEvent)
 
     # Preset handling methods moved to PresetHandler class
@@ -2675,8 +3030,24 @@ class JackConnectionManager(QMainWindow):
             self.auto_highlight_color = QColor(255, 140, 0)
             self.drag_highlight_color = QColor(200, 200, 200) # New color for drag highlight
 
+        # The colors are fixed from here on, so every widget can share the same sheet strings
+        self._list_qss = self._build_list_stylesheet()
+        self._button_qss = self._build_button_stylesheet()
+        self._line_edit_qss = self._build_line_edit_stylesheet()
+        # Connection line colors and pens depend on dark_mode, recompute them after a change
+        self._connection_colors = {}
+        self._connection_pens = {}
 
     def list_stylesheet(self):
+        return self._list_qss
+
+    def button_stylesheet(self):
+        return self._button_qss
+
+    def line_edit_stylesheet(self):
+        return self._line_edit_qss
+
+    def _build_list_stylesheet(self):
         highlight_bg = self.highlight_color.name()
         # Use white text for dark mode highlight, black for light mode highlight
         selected_text_color = "#ffffff" if self.dark_mode else "#000000"
@@ -2703,12 +3074,24 @@ class JackConnectionManager(QMainWindow):
             /* QTreeView::item:hover {{ ... }} */
         """
 
-    def button_stylesheet(self):
+    def _build_button_stylesheet(self):
         return f"""
             QPushButton {{ background-color: {self.button_color.name()}; color: {self.text_color.name()}; }}
             QPushButton:hover {{ background-color: {self.highlight_color.name()}; }}
         """
 
+    def _build_line_edit_stylesheet(self):
+        # Filter boxes and the preset name field in the presets menu
+        return f"""
+            QLineEdit {{
+                background-color: {self.background_color.name()};
+                color: {self.text_color.name()};
+                border: 1px solid {self.text_color.name()};
+                padding: 2px;
+                border-radius: 3px;
+            }}
+        """
+
     def _get_selected_item_info(self, tree_widget):
         """Gets information about the currently selected item (port or group)."""
         if not hasattr(tree_widget, 'currentItem'):
@@ -2721,7 +3104,7 @@ class JackConnectionManager(QMainWindow):
         if is_group:
             return item.text(0), True # Return group name and True
         else:
-            port_name = item.data(0, Qt.ItemDataRole.UserRole)
+            port_name = item.text(0)
             return port_name, False # Return port name and False
 
     def _restore_selection(self, tree_widget, selection_info):
@@ -2733,22 +3116,17 @@ class JackConnectionManager(QMainWindow):
         if name_or_text is None:
             return
 
-        item_to_select = None
-        if is_group:
-            # Find group item by text
-            for i in range(tree_widget.topLevelItemCount()):
-                group_item = tree_widget.topLevelItem(i)
-                if group_item.text(0) == name_or_text:
-                    item_to_select = group_item
-                    break
-        else:
-            # Find port item by port name (UserRole data)
-            item_to_select = tree_widget.port_items.get(name_or_text)
+        # Group items are keyed by their group name, port items by their full port name
+        lookup = tree_widget.port_groups if is_group else tree_widget.port_items
+        item_to_select = lookup.get(name_or_text)
 
-        if item_to_select and not item_to_select.isHidden():
-            tree_widget.setCurrentItem(item_to_select)
+        # Skip when already current, setCurrentItem would re-emit the selection signals
+        if item_to_select and not item_to_select.isHidden() and tree_widget.currentItem() is not item_to_select:
+            # The caller redoes highlights and buttons itself once both trees are restored
+            with QSignalBlocker(tree_widget):
+                tree_widget.setCurrentItem(item_to_select)
 
-    def _refresh_single_port_type(self, port_type_to_refresh):
+    def _refresh_single_port_type(self, port_type_to_refresh, resync=False):
         """Helper method to refresh ports for a specific type (audio or midi)."""
         # 1. Determine context based on port_type_to_refresh
         if port_type_to_refresh == 'audio':
@@ -2768,6 +3146,9 @@ class JackConnectionManager(QMainWindow):
         else:
             print(f"Warning: Invalid port_type '{port_type_to_refresh}' passed to _refresh_single_port_type")
             return # Should not happen
+        self._built_port_types.add(port_type_to_refresh)
+        # Callers such as preset loading change connections right before refreshing
+        self.invalidate_connection_index()
 
         # Use shared filter edits (assuming they apply to both types or are handled correctly)
         current_input_filter = self.input_filter_edit.text() if hasattr(self, 'input_filter_edit') else ""
@@ -2779,76 +3160,108 @@ class JackConnectionManager(QMainWindow):
         previous_input_group_order = input_tree.get_current_group_order()
         previous_output_group_order = output_tree.get_current_group_order()
 
-        # 3. Clear visual tree for this type
-        input_tree.clear()
-        output_tree.clear()
+        # 3. No explicit clear: populate_tree rebuilds the trees only when the ports changed
 
         # 4. Get new port lists for this type
-        input_ports, output_ports = self._get_ports(is_midi=is_midi)
-
-        # 5. Repopulate trees for this type
-        input_tree.populate_tree(input_ports, previous_input_group_order)
-        output_tree.populate_tree(output_ports, previous_output_group_order)
+        input_ports, output_ports = self._get_ports(is_midi=is_midi, resync=resync)
 
-        # 6. Re-apply filter for this type
-        self.filter_ports(input_tree, current_input_filter)
-        self.filter_ports(output_tree, current_output_filter)
+        # Steps 5-9 touch many items (rebuild, filter, selection, highlights), paint once at the end
+        for tree in (input_tree, output_tree):
+            tree.setUpdatesEnabled(False)
+        try:
+            # 5. Repopulate trees for this type
+            input_tree.populate_tree(input_ports, previous_input_group_order)
+            output_tree.populate_tree(output_ports, previous_output_group_order)
+
+            # 6. Re-apply filter for this type, unless the kept items already show it
+            if input_tree.applied_filter_text != current_input_filter:
+                self.filter_ports(input_tree, current_input_filter, refresh=False)
+            if output_tree.applied_filter_text != current_output_filter:
+                self.filter_ports(output_tree, current_output_filter, refresh=False)
+
+            # 7. Restore selection for this type
+            self._restore_selection(input_tree, selected_input_info)
+            self._restore_selection(output_tree, selected_output_info)
+
+            # 8. Update visuals and button states for this type
+            update_visuals()
+            clear_highlights() # Clear old highlights before applying new ones
+            update_buttons()
+
+            # 9. Re-apply highlights based on the *restored* selection for this type
+            self._highlight_current_selection(input_tree, output_tree, is_midi)
+        finally:
+            for tree in (input_tree, output_tree):
+                tree.setUpdatesEnabled(True)
 
-        # 7. Restore selection for this type
-        self._restore_selection(input_tree, selected_input_info)
-        self._restore_selection(output_tree, selected_output_info)
+        # 10. Maintain collapse state if needed for this type
+        # Note: apply_collapse_state_to_current_trees already checks the current self.port_type
+        # If refresh_all is True, we might need a way to apply collapse state to both,
+        # or accept that it only applies to the currently *viewed* tab's setting.
+        # Let's stick to the latter for now, as modifying collapse state for an inactive tab might be unexpected.
+        # If the currently viewed tab matches the type being refreshed, apply its collapse state.
+        if self.port_type == port_type_to_refresh:
+             if hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked():
+                 self.apply_collapse_state_to_current_trees() # This method checks self.port_type internally
 
-        # 8. Update visuals and button states for this type
-        update_visuals()
-        clear_highlights() # Clear old highlights before applying new ones
-        update_buttons()
 
-        # 9. Re-apply highlights based on the *restored* selection for this type
-        restored_input_item = input_tree.currentItem()
-        restored_output_item = output_tree.currentItem()
+    def _highlight_current_selection(self, input_tree, output_tree, is_midi):
+        """Highlight the current items of both trees and whatever is connected to them."""
+        current_input_item = input_tree.currentItem()
+        current_output_item = output_tree.currentItem()
 
         # Highlight selected item itself (port or group)
-        if restored_input_item:
-            if restored_input_item.childCount() == 0: # Port
-                 port_name = restored_input_item.data(0, Qt.ItemDataRole.UserRole)
+        if current_input_item:
+            if current_input_item.childCount() == 0: # Port
+                 port_name = current_input_item.text(0)
                  if port_name: # Check if port_name is valid
                      self._highlight_tree_item(input_tree, port_name) # Highlight selected port
 
-        if restored_output_item:
-             if restored_output_item.childCount() == 0: # Port
-                 port_name = restored_output_item.data(0, Qt.ItemDataRole.UserRole)
+        if current_output_item:
+             if current_output_item.childCount() == 0: # Port
+                 port_name = current_output_item.text(0)
                  if port_name: # Check if port_name is valid
                      self._highlight_tree_item(output_tree, port_name) # Highlight selected port
 
+        if not (current_input_item or current_output_item):
+            return
+
         # Highlight connected items/groups
-        if restored_input_item:
-            if restored_input_item.childCount() > 0: # Group selected
-                self._highlight_connected_output_groups_for_input_group(restored_input_item, is_midi)
+        if current_input_item:
+            if current_input_item.childCount() > 0: # Group selected
+                self._highlight_connected_output_groups_for_input_group(current_input_item, is_midi)
             else: # Port selected
-                port_name = restored_input_item.data(0, Qt.ItemDataRole.UserRole)
+                port_name = current_input_item.text(0)
                 if port_name: # Ensure port_name is valid
                     self._highlight_connected_outputs_for_input(port_name, is_midi)
 
-        if restored_output_item:
-            if restored_output_item.childCount() > 0: # Group selected
-                self._highlight_connected_input_groups_for_output_group(restored_output_item, is_midi)
+        if current_output_item:
+            if current_output_item.childCount() > 0: # Group selected
+                self._highlight_connected_input_groups_for_output_group(current_output_item, is_midi)
             else: # Port selected
-                port_name = restored_output_item.data(0, Qt.ItemDataRole.UserRole)
+                port_name = current_output_item.text(0)
                 if port_name: # Ensure port_name is valid
                     self._highlight_connected_inputs_for_output(port_name, is_midi)
 
-        # 10. Maintain collapse state if needed for this type
-        # Note: apply_collapse_state_to_current_trees already checks the current self.port_type
-        # If refresh_all is True, we might need a way to apply collapse state to both,
-        # or accept that it only applies to the currently *viewed* tab's setting.
-        # Let's stick to the latter for now, as modifying collapse state for an inactive tab might be unexpected.
-        # If the currently viewed tab matches the type being refreshed, apply its collapse state.
-        if self.port_type == port_type_to_refresh:
-             if hasattr(self, 'collapse_all_checkbox') and self.collapse_all_checkbox.isChecked():
-                 self.apply_collapse_state_to_current_trees() # This method checks self.port_type internally
-
+    def _refresh_after_connection_change(self, is_midi):
+        """Update lines, highlights and buttons after connections changed; the port set is unchanged."""
+        self.invalidate_connection_index() # JACK's notification is still queued
+        if self.untangle_mode > 0:
+            # Untangled group order depends on the connections, so the trees need re-sorting
+            self.refresh_ports()
+            return
+        if is_midi:
+            self.update_midi_connections()
+            self.clear_midi_highlights()
+            self._highlight_current_selection(self.midi_input_tree, self.midi_output_tree, True)
+            self.update_midi_connection_buttons()
+        else:
+            self.update_connections()
+            self.clear_highlights()
+            self._highlight_current_selection(self.input_tree, self.output_tree, False)
+            self.update_connection_buttons()
 
-    def refresh_ports(self, refresh_all=False, from_shortcut=False):
+    def refresh_ports(self, refresh_all=False, from_shortcut=False, resync=False):
         """
         Refreshes the port lists displayed in the trees.
 
@@ -2856,6 +3269,7 @@ class JackConnectionManager(QMainWindow):
             refresh_all (bool): If True, refresh both audio and MIDI ports.
                                 If False, refresh only the currently active port type.
             from_shortcut (bool): If True, animate the refresh button press.
+            resync (bool): If True, re-read the port lists from JACK instead of the port name cache.
         """
         # Animate the refresh button if triggered by shortcut
         if from_shortcut:
@@ -2863,35 +3277,27 @@ class JackConnectionManager(QMainWindow):
             
         if refresh_all:
             # print("DEBUG: Refreshing ALL ports (Audio and MIDI)") # Optional debug log
-            self._refresh_single_port_type('audio')
-            self._refresh_single_port_type('midi')
+            self._refresh_single_port_type('audio', resync)
+            self._refresh_single_port_type('midi', resync)
         else:
             # print(f"DEBUG: Refreshing only {self.port_type} ports") # Optional debug log
-            self._refresh_single_port_type(self.port_type)
+            self._refresh_single_port_type(self.port_type, resync)
 
     # Add a new helper method to apply collapse state only to the current tab's trees
     def apply_collapse_state_to_current_trees(self):
         """Apply the collapse state to the currently visible trees only"""
         if self.port_type == 'audio':
-            if hasattr(self, 'input_tree') and self.collapse_all_checkbox.isChecked():
-                self.input_tree.collapseAllGroups()
-            elif hasattr(self, 'input_tree'):
-                self.input_tree.expandAllGroups()
-
-            if hasattr(self, 'output_tree') and self.collapse_all_checkbox.isChecked():
-                self.output_tree.collapseAllGroups()
-            elif hasattr(self, 'output_tree'):
-                self.output_tree.expandAllGroups()
+            trees = (self.output_tree, self.input_tree)
         elif self.port_type == 'midi':
-            if hasattr(self, 'midi_input_tree') and self.collapse_all_checkbox.isChecked():
-                self.midi_input_tree.collapseAllGroups()
-            elif hasattr(self, 'midi_input_tree'):
-                self.midi_input_tree.expandAllGroups()
-
-            if hasattr(self, 'midi_output_tree') and self.collapse_all_checkbox.isChecked():
-                self.midi_output_tree.collapseAllGroups()
-            elif hasattr(self, 'midi_output_tree'):
-                self.midi_output_tree.expandAllGroups()
+            trees = (self.midi_output_tree, self.midi_input_tree)
+        else:
+            return
+        collapse = self.collapse_all_checkbox.isChecked()
+        for tree in trees:
+            if collapse:
+                tree.collapseAllGroups()
+            else:
+                tree.expandAllGroups()
 
     def _set_current_item_by_text(self, list_widget, text):
         for i in range(list_widget.count()):
@@ -2900,82 +3306,113 @@ class JackConnectionManager(QMainWindow):
                 break
 
     def _sort_ports(self, port_names):
-        def get_sort_key(port_name):
-            parts = re.split(r'(\d+)', port_name)
-            key = []
-            for part in parts:
-                if part.isdigit():
-                    key.append(int(part))
-                else:
-                    key.append(part.lower())
-            return key
+        return sorted(port_names, key=_natural_sort_key)
 
-        return sorted(port_names, key=get_sort_key)
 
+    def _get_ports(self, is_midi, resync=False):
+        """Sorted input and output port names, served from the port name cache."""
+        if resync or (is_midi, True) not in self._port_names:
+            try:
+                self._read_ports_from_jack()
+            except jack.JackError as e:
+                print(f"Error getting ports: {e}")
+                return [], []
+        return self._get_sorted_port_names(is_midi, True), self._get_sorted_port_names(is_midi, False)
+
+    def _get_sorted_port_names(self, is_midi, is_input):
+        key = (is_midi, is_input)
+        if key not in self._sorted_port_names:
+            self._sorted_port_names[key] = self._sort_ports(self._port_names[key])
+        return list(self._sorted_port_names[key]) # Callers may modify their copy
+
+    def _update_port_name_cache(self, register, port_name, is_input, is_midi):
+        """Keep the port name cache in step with JACK (un)registrations."""
+        if register:
+            names = self._port_names.get((is_midi, is_input))
+            if names is not None: # Unseeded types are read from JACK on first use
+                names.add(port_name)
+                self._sorted_port_names.pop((is_midi, is_input), None)
+        else:
+            # The type of a port being unregistered isn't always reliable, check every set
+            for key, names in self._port_names.items():
+                if port_name in names:
+                    names.discard(port_name)
+                    self._sorted_port_names.pop(key, None)
+
+    def _read_ports_from_jack(self):
+        """(Re)seed the port name cache for both types from a single JACK query."""
+        self._port_names = self._query_port_names()
+        self._sorted_port_names = {}
+
+    def _query_port_names(self):
+        """Current port names per (is_midi, is_input), as reported by JACK."""
+        port_names = {(False, True): set(), (False, False): set(),
+                      (True, True): set(), (True, False): set()}
+        # Partition by the port object's own flags. Everything that isn't MIDI is
+        # listed on the Audio tab, as an unfiltered is_midi=False query would.
+        # Names are interned so the trees' keys share storage with connection snapshots.
+        for port in self.client.get_ports():
+            if port is not None:
+                port_names[(port.is_midi, port.is_input)].add(sys.intern(port.name))
+        return port_names
 
-    def _get_ports(self, is_midi):
-        input_ports = []
-        output_ports = []
+    def _resync_port_cache(self):
+        """Re-read the ports from JACK and rebuild the trees if the port name cache had drifted."""
         try:
-            # Get input port objects
-            input_port_objects = self.client.get_ports(is_input=True, is_midi=is_midi)
-
-            # Get output port objects
-            output_port_objects = self.client.get_ports(is_output=True, is_midi=is_midi)
-
-            # Explicitly filter for the Audio tab (is_midi=False)
-            # Ensure only ports reported as non-MIDI by the port object itself are included.
-            if not is_midi:
-                input_port_objects = [p for p in input_port_objects if p is not None and not p.is_midi]
-                output_port_objects = [p for p in output_port_objects if p is not None and not p.is_midi]
-            else:
-                # For MIDI tab, just ensure ports are not None
-                input_port_objects = [p for p in input_port_objects if p is not None]
-                output_port_objects = [p for p in output_port_objects if p is not None]
-
-
-            # Extract names from the filtered objects
-            input_ports = [p.name for p in input_port_objects]
-            output_ports = [p.name for p in output_port_objects]
-
-            # Sort the names
-            input_ports = self._sort_ports(input_ports)
-            output_ports = self._sort_ports(output_ports)
+            port_names = self._query_port_names()
         except jack.JackError as e:
             print(f"Error getting ports: {e}")
-            # Return current lists even if incomplete
-            pass
+            return
+        if port_names == self._port_names:
+            return # The usual case, nothing to redraw
+        self._port_names = port_names
+        self._sorted_port_names = {}
+        if not self.callbacks_enabled:
+            return # Trees pick the cache up on the next manual refresh
+        for port_type in ('audio', 'midi'):
+            if port_type in self._built_port_types:
+                self._refresh_single_port_type(port_type)
+
+    def _get_connection_index(self, is_midi):
+        """Return ({output: frozenset(inputs)}, {input: frozenset(outputs)}) for one port type.
 
-        return input_ports, output_ports
+        Built from JACK on first use and kept until invalidate_connection_index().
+        """
+        index = self._connection_index[is_midi]
+        if index is not None:
+            return index
+        if (is_midi, False) not in self._port_names:
+            self._read_ports_from_jack()
+        outputs_to_inputs = {}
+        inputs_to_outputs = {}
+        # Output names come from the port name cache, only the connections need JACK
+        for output_name in self._port_names[(is_midi, False)]:
+            try:
+                input_names = frozenset(c.name for c in self.client.get_all_connections(output_name))
+            except jack.JackError:
+                continue # Port vanished between listing and querying
+            outputs_to_inputs[output_name] = input_names
+            for input_name in input_names:
+                inputs_to_outputs.setdefault(input_name, set()).add(output_name)
+        index = (outputs_to_inputs, {name: frozenset(outs) for name, outs in inputs_to_outputs.items()})
+        self._connection_index[is_midi] = index
+        return index
+
+    def invalidate_connection_index(self):
+        """Forget the cached connection index, the next highlight re-reads JACK."""
+        self._connection_index = {False: None, True: None}
 
     def _highlight_connected_ports(self, current_input_text, current_output_text, is_midi):
         try:
+            outputs_to_inputs, inputs_to_outputs = self._get_connection_index(is_midi)
             if current_input_text:
-                # Get only relevant output ports
-                output_ports = self.client.get_ports(is_output=True, is_midi=is_midi)
-                for output_port in output_ports:
-                    try:
-                        connections = self.client.get_all_connections(output_port)
-                        if current_input_text in [c.name for c in connections]:
-                            if is_midi:
-                                self.highlight_midi_output(output_port.name, auto_highlight=True)
-                            else:
-                                self.highlight_output(output_port.name, auto_highlight=True)
-                    except jack.JackError:
-                        continue
+                highlight = self.highlight_midi_output if is_midi else self.highlight_output
+                for output_name in inputs_to_outputs.get(current_input_text, ()):
+                    highlight(output_name, auto_highlight=True)
             if current_output_text:
-                # Get only relevant input ports
-                input_ports = self.client.get_ports(is_input=True, is_midi=is_midi)
-                for input_port in input_ports:
-                    try:
-                        connections = self.client.get_all_connections(input_port)
-                        if current_output_text in [c.name for c in connections]:
-                            if is_midi:
-                                self.highlight_midi_input(input_port.name, auto_highlight=True)
-                            else:
-                                self.highlight_input(input_port.name, auto_highlight=True)
-                    except jack.JackError:
-                        continue
+                highlight = self.highlight_midi_input if is_midi else self.highlight_input
+                for input_name in outputs_to_inputs.get(current_output_text, ()):
+                    highlight(input_name, auto_highlight=True)
         except jack.JackError as e:
             print(f"Error highlighting connected ports: {e}")
 
@@ -2991,7 +3428,9 @@ class JackConnectionManager(QMainWindow):
     def break_midi_connection(self, output_name, input_name):
         self._port_operation('disconnect', output_name, input_name, is_midi=True)
 
-    def _port_operation(self, operation_type, output_name, input_name, is_midi):
+    def _port_operation(self, operation_type, output_name, input_name, is_midi, refresh=True):
+        """Connect or disconnect one pair and record it. Batches pass refresh=False and
+        update the UI once themselves; returns True if JACK made the change."""
         try:
             if operation_type == 'connect':
                 # Check if connection already exists before attempting to connect
@@ -3005,20 +3444,20 @@ class JackConnectionManager(QMainWindow):
                     pass
 
                 self.client.connect(output_name, input_name)
-                self.connection_history.add_action('connect', output_name, input_name)
+                self.connection_history.add_action('connect', output_name, input_name, is_midi)
             else:
                 self.client.disconnect(output_name, input_name)
-                self.connection_history.add_action('disconnect', output_name, input_name)
+                self.connection_history.add_action('disconnect', output_name, input_name, is_midi)
 
-            self.update_undo_redo_buttons()
-            self.update_connections()
-            self.refresh_ports()
-            self.update_connection_buttons()
-            self.update_midi_connection_buttons()
+            if refresh:
+                self.update_undo_redo_buttons()
+                self._refresh_after_connection_change(is_midi)
+            return True
 
         except jack.JackError as e:
             print(f"{operation_type.capitalize()} error: {e}")
             # Don't crash on connection errors, just log them
+            return False
 
     # Add this new method to the JackConnectionManager class
     def make_multiple_connections(self, outputs, inputs):
@@ -3211,13 +3650,13 @@ class JackConnectionManager(QMainWindow):
         if not item:
             return []
         if item.childCount() == 0:  # It's a port item
-            port_name = item.data(0, Qt.ItemDataRole.UserRole)
+            port_name = item.text(0)
             return [port_name] if port_name else []
         else:  # It's a group item
             ports = []
             for i in range(item.childCount()):
                 child = item.child(i)
-                port_name = child.data(0, Qt.ItemDataRole.UserRole)
+                port_name = child.text(0)
                 if port_name:
                     ports.append(port_name)
             return ports
@@ -3314,18 +3753,14 @@ class JackConnectionManager(QMainWindow):
         
         action = self.connection_history.undo()
         if action:
-            action_type, output_name, input_name = action
-            is_midi = 'midi' in output_name or 'midi' in input_name # heuristic to determine midi or audio
+            action_type, output_name, input_name, is_midi = action
             try:
                 if action_type == 'connect':
                     self.client.connect(output_name, input_name)
                 else:
                     self.client.disconnect(output_name, input_name)
                 self.update_undo_redo_buttons()
-                self.update_connections()
-                self.refresh_ports()
-                self.update_connection_buttons() # Updated here
-                self.update_midi_connection_buttons() # Updated here
+                self._refresh_after_connection_change(is_midi)
 
             except jack.JackError as e:
                 print(f"Undo error: {e}")
@@ -3337,38 +3772,42 @@ class JackConnectionManager(QMainWindow):
         
         action = self.connection_history.redo()
         if action:
-            action_type, output_name, input_name = action
-            is_midi = 'midi' in output_name or 'midi' in input_name # heuristic to determine midi or audio
+            action_type, output_name, input_name, is_midi = action
             try:
                 if action_type == 'connect':
                     self.client.connect(output_name, input_name)
                 else:
                     self.client.disconnect(output_name, input_name)
                 self.update_undo_redo_buttons()
-                self.update_connections()
-                self.refresh_ports()
-                self.update_connection_buttons() # Updated here
-                self.update_midi_connection_buttons() # Updated here
+                self._refresh_after_connection_change(is_midi)
             except jack.JackError as e:
                 print(f"Redo error: {e}")
 
 
-    def disconnect_node(self, node_name):
-        is_midi = 'midi' in node_name # heuristic to determine midi or audio
-        ports = self.client.get_ports(is_input=True) if node_name in [port.name for port in self.client.get_ports(is_input=True)] else self.client.get_ports(is_output=True)
-        if node_name in [port.name for port in self.client.get_ports(is_input=True)]:
-            for output_port in self.client.get_ports(is_output=True):
-                if node_name in [conn.name for conn in self.client.get_all_connections(output_port)]:
-                    if not is_midi:
-                        self.break_connection(output_port.name, node_name)
-                    else:
-                        self.break_midi_connection(output_port.name, node_name)
-        elif node_name in [port.name for port in self.client.get_ports(is_output=True)]:
-            for input_port in self.client.get_all_connections(node_name):
-                    if not is_midi:
-                        self.break_connection(node_name, input_port.name)
-                    else:
-                        self.break_midi_connection(node_name, input_port.name)
+    def disconnect_node(self, node_name, refresh=True):
+        """Break every connection of a single port. Returns True if any was broken."""
+        # Look the port up once: its own flags give the direction and type,
+        # and its connection list is exactly what needs breaking.
+        try:
+            port = self.client.get_port_by_name(node_name)
+            connected_names = [c.name for c in self.client.get_all_connections(port)]
+        except jack.JackError as e:
+            print(f"Error disconnecting {node_name}: {e}")
+            return False
+
+        # Break them all first; refreshing after each one would redraw (or re-sort) per connection
+        changed = False
+        for other_name in connected_names:
+            if port.is_input:
+                output_name, input_name = other_name, node_name
+            else:
+                output_name, input_name = node_name, other_name
+            changed = self._port_operation('disconnect', output_name, input_name, port.is_midi,
+                                           refresh=False) or changed
+        if changed and refresh:
+            self.update_undo_redo_buttons()
+            self._refresh_after_connection_change(port.is_midi)
+        return changed
 
 
     def disconnect_selected_groups(self, group_items):
@@ -3380,7 +3819,7 @@ class JackConnectionManager(QMainWindow):
             if group_item and group_item.childCount() > 0:
                 for i in range(group_item.childCount()):
                     port_item = group_item.child(i)
-                    port_name = port_item.data(0, Qt.ItemDataRole.UserRole)
+                    port_name = port_item.text(0)
                     if port_name:
                         ports_to_disconnect.add(port_name)
 
@@ -3389,12 +3828,15 @@ class JackConnectionManager(QMainWindow):
             return
 
         # print(f"Disconnecting ports from selected groups: {ports_to_disconnect}") # Optional: logging
+        changed = False
         for port_name in ports_to_disconnect:
-            # Use the existing disconnect_node logic which handles connections
-            # and updates history/UI via break_connection/_port_operation
-            self.disconnect_node(port_name)
+            # disconnect_node records each broken connection in the history; the UI is updated once below
+            changed = self.disconnect_node(port_name, refresh=False) or changed
 
-        # No explicit refresh needed here as disconnect_node triggers updates
+        if changed:
+            # The context menu belongs to a tree on the visible tab
+            self.update_undo_redo_buttons()
+            self._refresh_after_connection_change(self.port_type == 'midi')
 
 
     def get_port_position(self, tree_widget, port_name, connection_view):
@@ -3421,7 +3863,7 @@ class JackConnectionManager(QMainWindow):
         if rect.height() <= 0:
             return None
 
-        is_output = tree_widget in (self.output_tree, self.midi_output_tree)
+        is_output = tree_widget.port_role == 'output' # Set once when the tree is created
 
         # Calculate the point at the middle-right or middle-left of the item
         point = QPointF(tree_widget.viewport().width() if is_output else 0,
@@ -3433,80 +3875,153 @@ class JackConnectionManager(QMainWindow):
         return connection_view.mapToScene(scene_point)
 
     def get_random_color(self, base_name):
-        random.seed(base_name)
-        return QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+        # A private generator gives the same color for a name as seeding the global one did
+        rng = random.Random(base_name)
+        return QColor(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255))
+
+    def _get_connection_color(self, base_name):
+        """Line color for connections from one client, computed once per client."""
+        color = self._connection_colors.get(base_name)
+        if color is None:
+            color = self.get_random_color(base_name)
+            # Brighten the color in dark mode for better visibility
+            if self.dark_mode:
+                # Make colors more vibrant and brighter in dark mode
+                h, s, v, a = color.getHsvF()
+                # Increase saturation and value for more vibrant appearance
+                s = min(1.0, s * 1.4)  # Increase saturation by 40%
+                v = min(1.0, v * 1.3)  # Increase brightness by 30%
+                color.setHsvF(h, s, v, a)
+            self._connection_colors[base_name] = color
+        return color
+
+    def _get_connection_pen(self, base_name):
+        """Shared pen for connections from one client; items copy it in setPen."""
+        pen = self._connection_pens.get(base_name)
+        if pen is None:
+            if len(self._connection_pens) >= self.CONNECTION_STYLE_CACHE_LIMIT:
+                # Client names can be unique per run of an app, don't let them pile up
+                self._connection_pens.clear()
+                self._connection_colors.clear()
+            pen = QPen(self._get_connection_color(base_name), 2)
+            self._connection_pens[base_name] = pen
+        return pen
+
+    def _request_connection_snapshot(self, is_midi):
+        """Start a background connection snapshot unless one is already running."""
+        if is_midi in self._snapshot_jobs:
+            return
+        job = _SnapshotJob(self.client, is_midi)
+        job.signals.ready.connect(self._on_snapshot_ready)
+        self._snapshot_jobs[is_midi] = job # Keep a reference until the result arrives
+        QThreadPool.globalInstance().start(job)
+
+    def _on_snapshot_ready(self, is_midi, succeeded, connections):
+        """Store a finished snapshot and redraw if the connections changed."""
+        self._snapshot_jobs.pop(is_midi, None)
+        if not succeeded or connections == self._connection_snapshots[is_midi]:
+            return # Keep drawing the last good snapshot
+        self._connection_snapshots[is_midi] = connections
+        if is_midi:
+            self.update_midi_connections()
+        else:
+            self.update_connections()
+
+    def _is_port_tab_visible(self, tab_widget):
+        """Whether the given port tab is the one currently shown."""
+        return self.tab_widget.currentWidget() is tab_widget
 
     def update_connections(self):
+        # Hidden scenes are skipped, switch_tab redraws a port tab when it becomes visible
+        if not self._is_port_tab_visible(self.audio_tab_widget):
+            return
         self._update_connection_graphics(self.connection_scene, self.connection_view,
                                         self.output_tree, self.input_tree, is_midi=False)
 
     def update_midi_connections(self):
+        if not self._is_port_tab_visible(self.midi_tab_widget):
+            return
         self._update_connection_graphics(self.midi_connection_scene, self.midi_connection_view,
                                         self.midi_output_tree, self.midi_input_tree, is_midi=True)
 
+    def _get_draw_signature(self, view, output_tree, input_tree, connections):
+        """Everything the connection lines depend on, cheap enough to compare on every refresh."""
+        # Where each tree's viewport sits relative to the view covers splitter drags and scroll bars appearing
+        origin = QPoint(0, 0)
+        return (view.size(), connections,
+                output_tree.layout_generation, view.mapFromGlobal(output_tree.viewport().mapToGlobal(origin)),
+                output_tree.viewport().width(),
+                input_tree.layout_generation, view.mapFromGlobal(input_tree.viewport().mapToGlobal(origin)))
+
     def _update_connection_graphics(self, scene, view, output_tree, input_tree, is_midi):
-        # Clear the scene first
-        scene.clear()
         view_rect = view.rect()
         scene_rect = QRectF(0, 0, view_rect.width(), view_rect.height())
-        scene.setSceneRect(scene_rect)
-
-        # Get all connections
-        connections = []
-        try:
-            ports = self.client.get_ports()
-            for output_port in ports:
-                if output_port.is_output and output_port.is_midi == is_midi:
-                    for input_port in self.client.get_all_connections(output_port):
-                        if input_port.is_input and input_port.is_midi == is_midi:
-                            connections.append((output_port.name, input_port.name))
-        except jack.JackError as e:
-            print(f"Error getting connections: {e}")
+        if scene.sceneRect() != scene_rect:
+            scene.setSceneRect(scene_rect)
+
+        # Draw from the last snapshot and ask the worker for a fresh one
+        self._request_connection_snapshot(is_midi)
+        connections = self._connection_snapshots[is_midi]
+        if connections is None:
+            return # First snapshot still in flight, _on_snapshot_ready will redraw
+
+        # The refresh timer and filter keystrokes mostly ask for the lines that are already drawn
+        draw_sig = self._get_draw_signature(view, output_tree, input_tree, connections)
+        if draw_sig == self._last_draw_sig[is_midi]:
             return
+        self._last_draw_sig[is_midi] = draw_sig
+
+        # A port usually has several connections, map each one's position only once per draw
+        output_positions = {}
+        input_positions = {}
+        # Existing line items are updated in place; only new or vanished lines add or remove items
+        path_items = self._path_items[is_midi]
+        drawn = set()
 
         # Draw each connection
         for output_name, input_name in connections:
-            start_pos = self.get_port_position(output_tree, output_name, view)
-            end_pos = self.get_port_position(input_tree, input_name, view)
+            if output_name in output_positions:
+                start_pos = output_positions[output_name]
+            else:
+                start_pos = output_positions[output_name] = self.get_port_position(output_tree, output_name, view)
+            if input_name in input_positions:
+                end_pos = input_positions[input_name]
+            else:
+                end_pos = input_positions[input_name] = self.get_port_position(input_tree, input_name, view)
 
             # Only draw connections where both ends are visible
             if start_pos and end_pos:
-                path = QPainterPath()
-                path.moveTo(start_pos)
-
-                # Calculate control points for a smooth curve
-                ctrl1_x = start_pos.x() + (end_pos.x() - start_pos.x()) / 3
-                ctrl2_x = start_pos.x() + 2 * (end_pos.x() - start_pos.x()) / 3
-
-                path.cubicTo(
-                    QPointF(ctrl1_x, start_pos.y()),
-                    QPointF(ctrl2_x, end_pos.y()),
-                    end_pos
-                )
-
-                # Use a consistent color for connections from the same source
-                base_name = output_name.rsplit(':', 1)[0]
-
-                # Get a base random color
-                random.seed(base_name)
-                base_color = QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-
-                # Brighten the color in dark mode for better visibility
-                if self.dark_mode:
-                    # Make colors more vibrant and brighter in dark mode
-                    h, s, v, a = base_color.getHsvF()
-                    # Increase saturation and value for more vibrant appearance
-                    s = min(1.0, s * 1.4)  # Increase saturation by 40%
-                    v = min(1.0, v * 1.3)  # Increase brightness by 30%
-                    base_color.setHsvF(h, s, v, a)
-
-                pen = QPen(base_color, 2)
-                path_item = QGraphicsPathItem(path)
-                path_item.setPen(pen)
-                scene.addItem(path_item)
-
-        # Fit the view to show all connections
-        view.fitInView(scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+                path = QPainterPath(start_pos)
+
+                # Calculate control points for a smooth curve, at a third and two thirds across
+                start_x, start_y = start_pos.x(), start_pos.y()
+                end_x, end_y = end_pos.x(), end_pos.y()
+                third = (end_x - start_x) / 3
+
+                # The float overload spares two temporary QPointF objects per line
+                path.cubicTo(start_x + third, start_y, start_x + 2 * third, end_y, end_x, end_y)
+
+                key = (output_name, input_name)
+                drawn.add(key)
+                path_item = path_items.get(key)
+                if path_item is None:
+                    path_item = QGraphicsPathItem(path)
+                    # Use a consistent color for connections from the same source
+                    base_name = output_name.rsplit(':', 1)[0]
+                    path_item.setPen(self._get_connection_pen(base_name))
+                    scene.addItem(path_item)
+                    path_items[key] = path_item
+                elif path_item.path() != path:
+                    path_item.setPath(path)
+
+        # Lines that were disconnected or whose ends scrolled out of view
+        for key in path_items.keys() - drawn:
+            scene.removeItem(path_items.pop(key))
+
+        # Fit the view to show all connections; the transform only changes with the scene rect
+        if self._fitted_scene_rects[is_midi] != scene_rect:
+            view.fitInView(scene_rect, Qt.AspectRatioMode.KeepAspectRatio)
+            self._fitted_scene_rects[is_midi] = scene_rect
 
     def on_input_clicked(self, item, column):
         self._on_port_clicked(item, self.input_tree, self.output_tree, False)
@@ -3540,7 +4055,7 @@ class JackConnectionManager(QMainWindow):
             # clicked_tree.setCurrentItem(item) # Let the mousePressEvent handle selection setting
 
             # Highlight the clicked item itself
-            port_name_or_group = item.data(0, Qt.ItemDataRole.UserRole) or item.text(0)
+            port_name_or_group = item.text(0) # Port items are labelled with their full name
             if is_midi:
                  if clicked_tree == self.midi_input_tree: self.highlight_midi_input(port_name_or_group)
                  else: self.highlight_midi_output(port_name_or_group)
@@ -3568,7 +4083,7 @@ class JackConnectionManager(QMainWindow):
                 self.update_connection_buttons()
         else:
             # Port item clicked - perform highlighting and update buttons
-            port_name = item.data(0, Qt.ItemDataRole.UserRole)
+            port_name = item.text(0)
             if not port_name: return # Should not happen, but safety check
 
             if is_midi:
@@ -3592,35 +4107,19 @@ class JackConnectionManager(QMainWindow):
 
     def _highlight_connected_outputs_for_input(self, input_name, is_midi):
         try:
-            # Get only relevant output ports
-            output_ports = self.client.get_ports(is_output=True, is_midi=is_midi)
-            for output_port in output_ports:
-                try:
-                    connections = self.client.get_all_connections(output_port)
-                    if input_name in [conn.name for conn in connections]:
-                        if is_midi:
-                            self.highlight_midi_output(output_port.name, auto_highlight=True)
-                        else:
-                            self.highlight_output(output_port.name, auto_highlight=True)
-                except jack.JackError:
-                    continue
+            inputs_to_outputs = self._get_connection_index(is_midi)[1]
+            highlight = self.highlight_midi_output if is_midi else self.highlight_output
+            for output_name in inputs_to_outputs.get(input_name, ()):
+                highlight(output_name, auto_highlight=True)
         except jack.JackError as e:
             print(f"Error highlighting connected outputs: {e}")
 
     def _highlight_connected_inputs_for_output(self, output_name, is_midi):
         try:
-            # Get only relevant input ports
-            input_ports = self.client.get_ports(is_input=True, is_midi=is_midi)
-            for input_port in input_ports:
-                try:
-                    connections = self.client.get_all_connections(input_port)
-                    if output_name in [c.name for c in connections]:
-                        if is_midi:
-                            self.highlight_midi_input(input_port.name, auto_highlight=True)
-                        else:
-                            self.highlight_input(input_port.name, auto_highlight=True)
-                except jack.JackError:
-                    continue
+            outputs_to_inputs = self._get_connection_index(is_midi)[0]
+            highlight = self.highlight_midi_input if is_midi else self.highlight_input
+            for input_name in outputs_to_inputs.get(output_name, ()):
+                highlight(input_name, auto_highlight=True)
         except jack.JackError as e:
             print(f"Error highlighting connected inputs: {e}")
 
@@ -3630,31 +4129,22 @@ class JackConnectionManager(QMainWindow):
         if not input_ports: return
 
         output_tree = self.midi_output_tree if is_midi else self.output_tree
-        highlight_func = self._highlight_group_item # Use the new group highlight function
 
         try:
-            # Iterate through all output ports to find connections to any port in the input group
-            output_port_objects = self.client.get_ports(is_output=True, is_midi=is_midi)
+            inputs_to_outputs = self._get_connection_index(is_midi)[1]
             connected_output_groups = set() # Store names of groups to highlight
 
-            for output_port in output_port_objects:
-                try:
-                    # Check if output port exists before querying
-                    if not any(p.name == output_port.name for p in self.client.get_ports(is_output=True, is_midi=is_midi)):
-                        continue
-                    connections = self.client.get_all_connections(output_port)
-                    # Check if this output port connects to *any* port in the selected input group
-                    if any(conn.name in input_ports for conn in connections):
-                        # Find the group this output port belongs to
-                        output_item = output_tree.port_items.get(output_port.name)
-                        if output_item and output_item.parent():
-                            connected_output_groups.add(output_item.parent().text(0))
-                except jack.JackError:
-                    continue # Ignore errors for individual ports
+            # Every output port connected to any port in the selected input group
+            for input_name in input_ports:
+                for output_name in inputs_to_outputs.get(input_name, ()):
+                    # Find the group this output port belongs to
+                    output_item = output_tree.port_items.get(output_name)
+                    if output_item and output_item.parent():
+                        connected_output_groups.add(output_item.parent().text(0))
 
             # Highlight the identified groups
             for group_name in connected_output_groups:
-                highlight_func(output_tree, group_name)
+                self._highlight_group_item(output_tree, group_name)
 
         except jack.JackError as e:
             print(f"Error highlighting connected output groups: {e}")
@@ -3665,30 +4155,22 @@ class JackConnectionManager(QMainWindow):
         if not output_ports: return
 
         input_tree = self.midi_input_tree if is_midi else self.input_tree
-        highlight_func = self._highlight_group_item # Use the new group highlight function
 
         try:
+            outputs_to_inputs = self._get_connection_index(is_midi)[0]
             connected_input_groups = set() # Store names of groups to highlight
 
-            # Iterate through all ports in the selected output group
+            # Ports that have gone away since the tree was built simply aren't in the index
             for output_name in output_ports:
-                try:
-                    # Check if output port exists before querying
-                    if not any(p.name == output_name for p in self.client.get_ports(is_output=True, is_midi=is_midi)):
-                        continue
-                    # Get all connections *from* this specific output port
-                    connections = self.client.get_all_connections(output_name)
-                    for input_port in connections:
-                        # Find the group this connected input port belongs to
-                        input_item = input_tree.port_items.get(input_port.name)
-                        if input_item and input_item.parent():
-                            connected_input_groups.add(input_item.parent().text(0))
-                except jack.JackError:
-                    continue # Ignore errors for individual ports
+                for input_name in outputs_to_inputs.get(output_name, ()):
+                    # Find the group this connected input port belongs to
+                    input_item = input_tree.port_items.get(input_name)
+                    if input_item and input_item.parent():
+                        connected_input_groups.add(input_item.parent().text(0))
 
             # Highlight the identified groups
             for group_name in connected_input_groups:
-                highlight_func(input_tree, group_name)
+                self._highlight_group_item(input_tree, group_name)
 
         except jack.JackError as e:
             print(f"Error highlighting connected input groups: {e}")
@@ -3712,12 +4194,14 @@ class JackConnectionManager(QMainWindow):
     def clear_drop_target_highlight(self, tree_widget):
         """Clear drop target highlighting"""
         if isinstance(tree_widget, QTreeWidget):
-            for i in range(tree_widget.topLevelItemCount()):
-                group_item = tree_widget.topLevelItem(i)
-                group_item.setBackground(0, QBrush(self.background_color))
-                for j in range(group_item.childCount()):
-                    child_item = group_item.child(j)
-                    child_item.setBackground(0, QBrush(self.background_color))
+            # Only the tree's current drag target is ever highlighted, so reset just that
+            # item instead of every row (dragMoveEvent calls this on each move over empty space)
+            item = getattr(tree_widget, 'current_drag_highlight_item', None)
+            if item is not None:
+                try:
+                    item.setBackground(0, QBrush(self.background_color))
+                except RuntimeError:
+                    pass # Item was deleted by a refresh during the drag
         else:
             # Maintain compatibility with list widgets
             super().clear_drop_target_highlight(tree_widget)
@@ -3728,6 +4212,7 @@ class JackConnectionManager(QMainWindow):
         if port_item:
             port_item.setForeground(0, QBrush(
                 self.highlight_color if not auto_highlight else self.auto_highlight_color))
+            tree_widget.highlighted.add((False, port_name))
 
     def _highlight_group_item(self, tree_widget, group_name):
         """Highlight a specific group item in a tree widget"""
@@ -3735,6 +4220,7 @@ class JackConnectionManager(QMainWindow):
         if group_item:
             # Use the auto_highlight_color for connected groups
             group_item.setForeground(0, QBrush(self.auto_highlight_color))
+            tree_widget.highlighted.add((True, group_name))
 
     def clear_highlights(self):
         self._clear_tree_highlights(self.input_tree)
@@ -3746,21 +4232,20 @@ class JackConnectionManager(QMainWindow):
 
     def _clear_tree_highlights(self, tree_widget):
         """Clear highlights from all group and port items in a tree widget"""
-        if not hasattr(tree_widget, 'topLevelItemCount'): return # Safety check
-
-        for i in range(tree_widget.topLevelItemCount()):
-            group_item = tree_widget.topLevelItem(i)
-            # Reset group item highlight
-            group_item.setForeground(0, QBrush(self.text_color))
-            # Reset child item highlights
-            for j in range(group_item.childCount()):
-                child_item = group_item.child(j)
-                child_item.setForeground(0, QBrush(self.text_color))
+        if not tree_widget.highlighted:
+            return
+        # Only the items we colored need resetting, every setForeground costs a
+        # dataChanged round trip through the view
+        brush = QBrush(self.text_color)
+        for is_group, name in tree_widget.highlighted:
+            item = (tree_widget.port_groups if is_group else tree_widget.port_items).get(name)
+            if item is not None: # Removed since it was highlighted
+                item.setForeground(0, brush)
+        tree_widget.highlighted.clear()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.update_connections()
-        self.update_midi_connections()
+        self._resize_redraw_timer.start() # Only the visible port tab is drawn, see update_connections
 
     def update_connection_buttons(self):
         self._update_port_connection_buttons(self.input_tree, self.output_tree,
@@ -3781,7 +4266,7 @@ class JackConnectionManager(QMainWindow):
                      continue # Skip if output port doesn't exist (e.g., just unregistered)
 
                 connections = self.client.get_all_connections(output_port)
-                conn_names = [c.name for c in connections]
+                conn_names = {c.name for c in connections} # Tested once per input port below
                 # Check if any connection target is within the input_ports list
                 if any(inp in conn_names for inp in input_ports):
                     return True # Found at least one connection between the groups
@@ -3804,7 +4289,7 @@ class JackConnectionManager(QMainWindow):
             # if item.isHidden(): continue # This check might be needed depending on filter implementation
 
             if item.childCount() == 0: # Is a port item (leaf)
-                port_name = item.data(0, Qt.ItemDataRole.UserRole)
+                port_name = item.text(0)
                 if port_name:
                     port_names.add(port_name)
             else: # Is a group item
@@ -3812,7 +4297,7 @@ class JackConnectionManager(QMainWindow):
                     child = item.child(i)
                     # Check if child is visible
                     # if child.isHidden(): continue
-                    port_name = child.data(0, Qt.ItemDataRole.UserRole)
+                    port_name = child.text(0)
                     if port_name:
                         port_names.add(port_name)
         return list(port_names) # Return as a list
@@ -3840,36 +4325,24 @@ class JackConnectionManager(QMainWindow):
             # Broader error during the process
             print(f"Error checking connections: {e}")
             return False # Assume no connection on error
-    def _get_existing_connections_between(self, output_ports, input_ports):
+    def _get_existing_connections_between(self, output_ports, input_ports, is_midi):
         """Returns a set of existing (output, input) connection tuples between the given port lists."""
         existing_connections = set()
         if not output_ports or not input_ports:
             return existing_connections
         try:
-            # Convert input_ports to a set for faster lookups
-            input_ports_set = set(input_ports)
-            for out_port in output_ports:
-                # Check connections for this output port
-                try:
-                    # Determine if MIDI based on current tab context
-                    is_midi = self.tab_widget.currentIndex() == 1
-                    # Ensure port exists before querying
-                    if not any(p.name == out_port for p in self.client.get_ports(is_output=True, is_midi=is_midi)):
-                        continue
-
-                    connections = self.client.get_all_connections(out_port)
-                    for conn in connections:
-                        # If the connected input port is in our target input set, add the tuple
-                        if conn.name in input_ports_set:
-                            existing_connections.add((out_port, conn.name))
-                except jack.JackError:
-                    continue # Ignore error for this specific output port
-            return existing_connections
+            outputs_to_inputs = self._get_connection_index(is_midi)[0]
         except jack.JackError as e:
-            # Broader error during the process
             print(f"Error getting existing connections: {e}")
-            return existing_connections # Return what we have found so far or empty set
-
+            return existing_connections
+        # Convert input_ports to a set for faster lookups
+        input_ports_set = set(input_ports)
+        for out_port in output_ports:
+            # Ports that no longer exist simply have no entry
+            for in_port in outputs_to_inputs.get(out_port, ()):
+                if in_port in input_ports_set:
+                    existing_connections.add((out_port, in_port))
+        return existing_connections
 
     def _update_port_connection_buttons(self, input_tree, output_tree, connect_button, disconnect_button):
         """Update connection button states based on selected ports (handles multi-select)."""
@@ -3890,7 +4363,8 @@ class JackConnectionManager(QMainWindow):
                     possible_connections.add((out_p, in_p))
 
             # 2. Determine existing connections between the selected ports
-            existing_connections = self._get_existing_connections_between(selected_output_ports, selected_input_ports)
+            is_midi = input_tree is self.midi_input_tree
+            existing_connections = self._get_existing_connections_between(selected_output_ports, selected_input_ports, is_midi)
 
             # 3. Enable Connect if there are possible connections that don't already exist.
             #    (i.e., the set of possible connections is not equal to the set of existing ones)
@@ -3913,76 +4387,70 @@ class JackConnectionManager(QMainWindow):
         output_text = self.output_filter_edit.text()
 
         if current_index == 0:  # Audio tab
-            if hasattr(self, 'input_tree'):
-                self.filter_ports(self.input_tree, input_text)
-            if hasattr(self, 'output_tree'):
-                self.filter_ports(self.output_tree, output_text)
+            trees = (self.input_tree, self.output_tree)
         elif current_index == 1:  # MIDI tab
-            if hasattr(self, 'midi_input_tree'):
-                self.filter_ports(self.midi_input_tree, input_text)
-            if hasattr(self, 'midi_output_tree'):
-                self.filter_ports(self.midi_output_tree, output_text)
-        # No filtering needed for pw-top tab (index 2)
-
-        # Refresh visualization after filtering
-        # Note: filter_ports itself calls refresh_visualizations, so this might be redundant,
-        # but keeping it here ensures visualization updates even if filter_ports logic changes.
-        # Update: Removed redundant call as filter_ports handles it.
-        # self.refresh_visualizations() # Redundant call removed
-
-    def filter_ports(self, tree_widget, filter_text):
+            trees = (self.midi_input_tree, self.midi_output_tree)
+        else:
+            return # No filtering needed for pw-top tab (index 2)
+
+        # Only the box that was edited needs its tree filtered again; redraw once for both
+        filtered = False
+        for tree, text in zip(trees, (input_text, output_text)):
+            if tree.applied_filter_text != text:
+                self.filter_ports(tree, text, refresh=False)
+                filtered = True
+        if filtered:
+            self.refresh_visualizations()
+
+    def filter_ports(self, tree_widget, filter_text, refresh=True):
         """Filters the items in the specified tree widget based on the filter text,
-           supporting exclusion with '-' prefix."""
+           supporting exclusion with '-' prefix. Callers that redraw anyway pass refresh=False."""
         filter_text_lower = filter_text.lower()
         terms = filter_text_lower.split()
         include_terms = [term for term in terms if not term.startswith('-')]
         exclude_terms = [term[1:] for term in terms if term.startswith('-') and len(term) > 1] # Remove '-'
 
-        # Iterate through all top-level items (groups)
-        for i in range(tree_widget.topLevelItemCount()):
-            group_item = tree_widget.topLevelItem(i)
-            group_visible = False # Assume group is hidden unless a child matches
-
-            # Iterate through children (ports) of the group
-            for j in range(group_item.childCount()):
-                port_item = group_item.child(j)
-                port_name = port_item.data(0, Qt.ItemDataRole.UserRole) # Get full port name
-                if not port_name: # Skip if port name is invalid
-                    port_item.setHidden(True)
-                    continue
-
-                port_name_lower = port_name.lower()
-
-                # 1. Check exclusion terms
-                excluded = False
-                for term in exclude_terms:
-                    if term in port_name_lower:
-                        excluded = True
-                        break
-                if excluded:
-                    port_item.setHidden(True)
-                    continue # Skip to next port if excluded
-
-                # 2. Check inclusion terms (all must match)
-                included = True
-                if include_terms: # Only check if there are inclusion terms
-                    for term in include_terms:
-                        if term not in port_name_lower:
-                            included = False
-                            break
-
-                if included:
-                    port_item.setHidden(False)
-                    group_visible = True # Make group visible if this port is visible
-                else:
-                    port_item.setHidden(True)
+        # setHidden() schedules a relayout even when the state doesn't change, so only call it on changes
+        layout_changed = False
+        updates_were_enabled = tree_widget.updatesEnabled()
+        tree_widget.setUpdatesEnabled(False)
+        try:
+            # Iterate through all top-level items (groups)
+            for i in range(tree_widget.topLevelItemCount()):
+                group_item = tree_widget.topLevelItem(i)
+                group_visible = False # Assume group is hidden unless a child matches
 
-            # Set the visibility of the group item
-            group_item.setHidden(not group_visible)
+                # Iterate through children (ports) of the group
+                for j in range(group_item.childCount()):
+                    port_item = group_item.child(j)
+                    port_name = port_item.text(0) # Get full port name
+                    if not port_name: # Hide if port name is invalid
+                        hidden = True
+                    else:
+                        port_name_lower = port_name.lower()
+                        # Exclusion terms hide the port, inclusion terms must all match
+                        hidden = (any(term in port_name_lower for term in exclude_terms) or
+                                  not all(term in port_name_lower for term in include_terms))
+                    if port_item.isHidden() != hidden:
+                        port_item.setHidden(hidden)
+                        layout_changed = True
+                    if not hidden:
+                        group_visible = True # Make group visible if this port is visible
+
+                # Set the visibility of the group item
+                if group_item.isHidden() == group_visible:
+                    group_item.setHidden(not group_visible)
+                    layout_changed = True
+        finally:
+            tree_widget.setUpdatesEnabled(updates_were_enabled)
+        if layout_changed: # setHidden() doesn't go through the model, so its signals don't cover this
+            tree_widget.mark_layout_changed()
+        tree_widget.applied_filter_text = filter_text
 
         # After filtering, we need to refresh the connection visualization
         # because hidden items might affect line drawing positions.
-        self.refresh_visualizations()
+        if refresh:
+            self.refresh_visualizations()
 
     def refresh_visualizations(self):
         """Refresh only the connection visualizations without refreshing ports"""
@@ -3996,6 +4464,7 @@ class JackConnectionManager(QMainWindow):
         # Always quit the application when the window is closed
         event.accept()
         QApplication.quit()
+        self.config_manager.flush() # Don't lose settings changed just before closing
 
         # Original logic for minimizing (kept for reference, but bypassed):
         # if self.minimize_on_close:
@@ -4005,23 +4474,24 @@ class JackConnectionManager(QMainWindow):
         #     event.accept()
         #     QApplication.quit()
 
-        # Clean up JACK client and deactivate callbacks
-        if hasattr(self, 'client'):
-            self.callbacks_enabled = False
-            self.client.deactivate()
-            self.client.close()
-
-        # Stop the visualization refresh timers
+        # Stop everything that may still call into JACK before the client goes away
         self.connection_view.stop_refresh_timer()
         self.midi_connection_view.stop_refresh_timer()
+        self._port_resync_timer.stop()
+
+        # The jack_delay process and its duration timer belong to the latency tester
+        if self.latency_tester is not None:
+            self.latency_tester.stop_latency_test()
 
         # Stop pw-top monitor before closing
-        if hasattr(self, 'pwtop_monitor') and self.pwtop_monitor is not None:
+        if self.pwtop_monitor is not None:
             self.pwtop_monitor.stop()
 
-        # Stop latency test process before closing
-        if hasattr(self, 'latency_process') and self.latency_process is not None:
-            self.stop_latency_test()
+        # Clean up JACK client and deactivate callbacks
+        self.callbacks_enabled = False
+        QThreadPool.globalInstance().waitForDone() # Let running snapshot jobs finish with the client
+        self.client.deactivate()
+        self.client.close()
 
     # --- Font Size Control Methods ---
 
@@ -4030,14 +4500,9 @@ class JackConnectionManager(QMainWindow):
         font = QFont()
         font.setPointSize(self.port_list_font_size)
 
-        trees_to_update = []
-        if hasattr(self, 'input_tree'): trees_to_update.append(self.input_tree)
-        if hasattr(self, 'output_tree'): trees_to_update.append(self.output_tree)
-        if hasattr(self, 'midi_input_tree'): trees_to_update.append(self.midi_input_tree)
-        if hasattr(self, 'midi_output_tree'): trees_to_update.append(self.midi_output_tree)
-
-        for tree in trees_to_update:
+        for tree in self._all_trees:
             tree.setFont(font)
+            tree.mark_layout_changed() # Row heights change without any model signal
 
         # Refresh visualizations as item sizes might change
         self.refresh_visualizations()
@@ -4066,27 +4531,14 @@ class JackConnectionManager(QMainWindow):
         """Get connected ports for the given port names."""
         connected_ports = set()
         try:
-            if is_input_to_output:
-                # From input to output - look at all output ports
-                output_ports = self.client.get_ports(is_output=True, is_midi=is_midi)
-                for output_port in output_ports:
-                    try:
-                        connections = self.client.get_all_connections(output_port)
-                        # If this output connects to any of our input ports
-                        if any(conn.name in port_names for conn in connections):
-                            connected_ports.add(output_port.name)
-                    except jack.JackError:
-                        continue
-            else:
-                # From output to input - just get direct connections
-                for port_name in port_names:
-                    try:
-                        connections = self.client.get_all_connections(port_name)
-                        connected_ports.update(conn.name for conn in connections)
-                    except jack.JackError:
-                        continue
+            outputs_to_inputs, inputs_to_outputs = self._get_connection_index(is_midi)
         except jack.JackError as e:
             print(f"Error getting connected ports: {e}")
+            return []
+        # From input to output the index is keyed by input, otherwise by output
+        lookup = inputs_to_outputs if is_input_to_output else outputs_to_inputs
+        for port_name in port_names:
+            connected_ports.update(lookup.get(port_name, ()))
         return list(connected_ports)
 
     def _switch_focus_between_trees(self, forwards=True):
@@ -4167,7 +4619,7 @@ class JackConnectionManager(QMainWindow):
         # Refresh Shortcut (r)
         self.refresh_shortcut_action = QAction("Refresh Shortcut", self)
         self.refresh_shortcut_action.setShortcut(QKeySequence(Qt.Key.Key_R))
-        self.refresh_shortcut_action.triggered.connect(lambda: self.refresh_ports(from_shortcut=True))
+        self.refresh_shortcut_action.triggered.connect(lambda: self.refresh_ports(from_shortcut=True, resync=True))
 
         # Collapse All Shortcut (Alt+C)
         self.collapse_all_shortcut_action = QAction("Collapse All Shortcut", self)
@@ -4415,21 +4867,24 @@ def main():
     else:
         # --- Normal GUI Mode ---
         window = JackConnectionManager() # Create the main window only for GUI mode
-        window.start_startup_refresh() # Start the refresh sequence for GUI mode now
+        window.start_startup_refresh() # Populate the port lists for GUI mode now
 
         # Handle Ctrl+C gracefully (only needed for GUI mode)
         import signal
         def signal_handler(signum, frame):
             print("Received signal to terminate")
             if window: window.close() # Close window if it exists
-            app.quit()
-            sys.exit(0)
+            app.quit() # app.exec() below returns and main() cleans up
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
+        # Python only runs signal handlers when the interpreter gets control back. While
+        # app.exec() sleeps in Qt's event loop that never happens, so wake it up now and then
+        signal_wakeup_timer = QTimer()
+        signal_wakeup_timer.timeout.connect(lambda: None)
+        signal_wakeup_timer.start(200)
         window.show()
 
     try:
-        # Custom event loop that processes both Qt events and signals
         # Run the event loop regardless of headless mode to allow timers to fire
         exit_code = app.exec()
         if args.headless:
@@ -4443,8 +4898,8 @@ def main():
     finally:
         # Ensure cleanup happens
         # Check if window exists before accessing its attributes
-        if window and window.pw_process is not None:
-            window.stop_pwtop_process()
+        if window and window.pwtop_monitor is not None:
+            window.pwtop_monitor.stop()
         # Check if headless_manager exists for cleanup, otherwise check window
         # Ensure client cleanup happens correctly for both modes
         client_to_close = None